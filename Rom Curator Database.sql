@@ -419,11 +419,13 @@ CREATE INDEX IF NOT EXISTS idx_rom_file_content_role ON rom_file(content_role);
 -- Indexes for extension registry tables (v1.10)
 CREATE INDEX IF NOT EXISTS idx_file_extension_category ON file_extension(category_id);
 CREATE INDEX IF NOT EXISTS idx_file_extension_active ON file_extension(is_active);
+CREATE INDEX IF NOT EXISTS idx_file_extension_category_active ON file_extension(category_id, is_active);
 CREATE INDEX IF NOT EXISTS idx_file_extension_type ON file_extension(treat_as_archive, treat_as_disc, treat_as_auxiliary);
 CREATE INDEX IF NOT EXISTS idx_platform_extension_platform ON platform_extension(platform_id);
 CREATE INDEX IF NOT EXISTS idx_platform_extension_extension ON platform_extension(extension);
 CREATE INDEX IF NOT EXISTS idx_platform_extension_primary ON platform_extension(is_primary);
 CREATE INDEX IF NOT EXISTS idx_unknown_extension_status ON unknown_extension(status);
+CREATE INDEX IF NOT EXISTS idx_unknown_extension_status_seen ON unknown_extension(status, first_seen);
 CREATE INDEX IF NOT EXISTS idx_unknown_extension_extension ON unknown_extension(extension);
 
 
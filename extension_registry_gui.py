@@ -6,23 +6,112 @@ This module provides a comprehensive PyQt interface for managing the extension r
 including file type categories, file extensions, platform mappings, and unknown extension handling.
 """
 
-import sys
-import sqlite3
-from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple, Callable
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import product
+from typing import List, Dict, Optional, Any, Tuple, Callable, Iterable
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QListWidgetItem,
-    QLineEdit, QComboBox, QCheckBox, QGroupBox, QSplitter, QWidget, QTabWidget,
-    QAbstractItemView, QMessageBox, QInputDialog, QFormLayout, QTextEdit,
-    QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QStatusBar
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListView,
+    QLineEdit, QComboBox, QCheckBox, QGroupBox, QWidget, QTabWidget, QSpinBox,
+    QAbstractItemView, QMessageBox, QFormLayout, QTextEdit, QDialogButtonBox, QFileDialog,
+    QTableView, QHeaderView, QProgressBar, QStatusBar, QStyledItemDelegate,
+    QStyleOptionButton, QStyle, QApplication, QToolTip
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
-from PyQt5.QtGui import QFont, QMouseEvent, QPoint
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QThread, QTimer, QPoint, QRect, QEvent, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
+)
+from PyQt5.QtGui import QFont, QIcon, QPainter, QPixmap, QPixmapCache
 
 from extension_registry_manager import ExtensionRegistryManager
 
 
+# Delay before a search box re-filters, so a typed word triggers one pass
+FILTER_DELAY_MS = 200
+
+# How long transient status bar notices stay visible
+STATUS_MESSAGE_MS = 2000
+
+# Rows fetched per query for the paged extension and unknown extension tables
+PAGE_SIZE = 500
+
+# Uniform row height so the views never measure rows from their contents
+ROW_HEIGHT = 24
+
+# Size of the pixmaps that status emoji are rendered into
+ICON_SIZE = 16
+
+_EMOJI_ICONS: Dict[str, QIcon] = {}
+
+
+def _emoji_pixmap(emoji: str) -> QPixmap:
+    """Return an emoji rendered into a pixmap shared through ``QPixmapCache``."""
+    key = f"extension_registry:{emoji}:{ICON_SIZE}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(ICON_SIZE, ICON_SIZE)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        font = painter.font()
+        font.setPixelSize(ICON_SIZE - 2)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, emoji)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _emoji_icon(emoji: str) -> QIcon:
+    """Return the icon for an emoji so cells blit a pixmap instead of shaping text.
+    
+    Icons are memoised so every row shares one ``QIcon`` per glyph.
+    """
+    icon = _EMOJI_ICONS.get(emoji)
+    if icon is None:
+        icon = _EMOJI_ICONS[emoji] = QIcon(_emoji_pixmap(emoji))
+    return icon
+
+
+def _fill_combo(combo: QComboBox, choices: Iterable[Tuple[str, Any]], selected: Any = None):
+    """Add ``(label, data)`` choices to a combo in one pass and select ``selected``.
+    
+    Labels go in with a single ``addItems`` call; the current index falls back to
+    the first item when no choice carries ``selected``.
+    """
+    choices = list(choices)
+    start = combo.count()
+    combo.addItems([label for label, _ in choices])
+    current = 0
+    for offset, (_, data) in enumerate(choices):
+        combo.setItemData(start + offset, data)
+        if selected is not None and data == selected:
+            current = start + offset
+    combo.setCurrentIndex(current)
+
+
+@contextmanager
+def _batched_updates(view: QAbstractItemView):
+    """Suspend repaints, signals and sorting on a view during bulk changes."""
+    header = view.horizontalHeader() if isinstance(view, QTableView) else None
+    sorting = isinstance(view, QTableView) and view.isSortingEnabled()
+    stretch = header is not None and header.stretchLastSection()
+    view.setUpdatesEnabled(False)
+    view.blockSignals(True)
+    if header is not None:
+        view.setSortingEnabled(False)
+        header.setStretchLastSection(False)
+    try:
+        yield view
+    finally:
+        if header is not None:
+            header.setStretchLastSection(stretch)
+            view.setSortingEnabled(sorting)
+        view.blockSignals(False)
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
 class DraggableTitleBar(QWidget):
     """Custom title bar that allows dragging the window."""
     
@@ -51,15 +140,522 @@ class DraggableTitleBar(QWidget):
             event.accept()
 
 
+class RegistryTableModel(QAbstractTableModel):
+    """Read-only table model over the row dictionaries returned by the registry manager.
+
+    The view only asks for the cells it paints, so display strings are built on demand
+    instead of allocating an item per cell up front. Paged models report further rows
+    through ``canFetchMore`` and emit ``fetchMoreRequested`` when the view scrolls to
+    the end; the owner answers with ``append_rows``.
+    """
+
+    fetchMoreRequested = pyqtSignal()
+
+    HEADERS: Tuple[str, ...] = ()
+    COLUMN_WIDTHS: Tuple[int, ...] = ()
+    # Record fields matched by the search box, lower-cased once per load
+    SEARCH_FIELDS: Tuple[str, ...] = ()
+    # Formatted rows kept for repaints; a few screens' worth is plenty
+    ROW_CACHE_SIZE = 512
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._search_keys: List[str] = []
+        self._rows_by_key: Dict[Any, int] = {}
+        self._row_cache: "OrderedDict[int, Tuple[str, ...]]" = OrderedDict()
+        # Paging state: rows the query has returned so far, and whether it has more
+        self._fetched = 0
+        self._has_more = False
+        self._fetching = False
+
+    @property
+    def fetched_count(self) -> int:
+        """Number of query rows received, i.e. the offset of the next page."""
+        return self._fetched
+
+    def set_rows(self, rows: List[Dict[str, Any]], has_more: bool = False):
+        """Replace the model contents with a fresh result set."""
+        self.beginResetModel()
+        self._fetched = len(rows)
+        self._has_more = has_more
+        self._fetching = False
+        self._rows = list(rows)
+        self._search_keys = [self._build_search_key(record) for record in self._rows]
+        self._rows_by_key = {self.row_key(record): row for row, record in enumerate(self._rows)}
+        self._row_cache.clear()
+        self.endResetModel()
+
+    def _build_search_key(self, record: Dict[str, Any]) -> str:
+        """Join the searchable fields of a record into one lower-case string."""
+        return "\t".join(record[field] or "" for field in self.SEARCH_FIELDS).lower()
+
+    def search_key(self, row: int) -> str:
+        """Return the pre-lowered search text of a row."""
+        return self._search_keys[row]
+
+    def _display_row(self, row: int) -> Tuple[str, ...]:
+        """Return the formatted cells of a row, formatting it at most once."""
+        cells = self._row_cache.get(row)
+        if cells is None:
+            record = self._rows[row]
+            cells = tuple(self.display_text(record, column) for column in range(len(self.HEADERS)))
+            self._row_cache[row] = cells
+            if len(self._row_cache) > self.ROW_CACHE_SIZE:
+                self._row_cache.popitem(last=False)
+        else:
+            self._row_cache.move_to_end(row)
+        return cells
+
+    def row_at(self, row: int) -> Dict[str, Any]:
+        """Return the raw record backing a row."""
+        return self._rows[row]
+
+    def find_row(self, key: Any) -> Optional[int]:
+        """Return the row whose ``row_key`` equals ``key``."""
+        return self._rows_by_key.get(key)
+
+    def update_row(self, row: int, changes: Dict[str, Any]):
+        """Apply field changes to one record and repaint only that row."""
+        self._rows[row].update(changes)
+        self._search_keys[row] = self._build_search_key(self._rows[row])
+        self._row_cache.pop(row, None)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def append_rows(self, rows: List[Dict[str, Any]], has_more: bool = False):
+        """Append the next page of the query, skipping rows already added in place."""
+        self._fetched += len(rows)
+        self._has_more = has_more
+        self._fetching = False
+        rows = [record for record in rows if self.row_key(record) not in self._rows_by_key]
+        if not rows:
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for row, record in enumerate(rows, first):
+            self._rows.append(record)
+            self._search_keys.append(self._build_search_key(record))
+            self._rows_by_key[self.row_key(record)] = row
+        self.endInsertRows()
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every row of the query has been loaded."""
+        return not self._has_more
+
+    def cancel_fetch(self):
+        """Allow another ``fetchMore`` after a page failed to load."""
+        self._fetching = False
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._fetching = True
+            self.fetchMoreRequested.emit()
+
+    def insert_row(self, record: Dict[str, Any]):
+        """Append one record without resetting the model."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(record)
+        self._search_keys.append(self._build_search_key(record))
+        self._rows_by_key[self.row_key(record)] = row
+        self.endInsertRows()
+
+    def remove_row(self, row: int):
+        """Remove one record without resetting the model."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        record = self._rows.pop(row)
+        # The record left the query's result set, so the next page starts one earlier
+        self._fetched = max(self._fetched - 1, 0)
+        del self._search_keys[row]
+        del self._rows_by_key[self.row_key(record)]
+        for index in range(row, len(self._rows)):
+            self._rows_by_key[self.row_key(self._rows[index])] = index
+        # Cached cells are keyed by row number, which shifted
+        self._row_cache.clear()
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._display_row(index.row())[index.column()]
+
+        record = self._rows[index.row()]
+        if role == Qt.DecorationRole:
+            emoji = self.decoration(record, index.column())
+            return _emoji_icon(emoji) if emoji else None
+        if role == Qt.UserRole:
+            return self.row_key(record)
+        return None
+
+    def display_text(self, record: Dict[str, Any], column: int) -> str:
+        """Format a single cell for display."""
+        raise NotImplementedError
+
+    def decoration(self, record: Dict[str, Any], column: int) -> Optional[str]:
+        """Return the emoji shown as a cell's icon, if any."""
+        return None
+
+    def row_key(self, record: Dict[str, Any]) -> Any:
+        """Return the identifier passed to row actions."""
+        raise NotImplementedError
+
+
+class CategoriesListModel(RegistryTableModel):
+    """Single-column model for the categories list."""
+
+    HEADERS = ("Category",)
+
+    def display_text(self, record: Dict[str, Any], column: int) -> str:
+        if record['description']:
+            return f"{record['name']} - {record['description']}"
+        return record['name']
+
+    def decoration(self, record: Dict[str, Any], column: int) -> Optional[str]:
+        return "✅" if record['is_active'] else "❌"
+
+    def row_key(self, record: Dict[str, Any]) -> int:
+        return record['category_id']
+
+
+class ExtensionsTableModel(RegistryTableModel):
+    """Table model for the file extensions tab."""
+
+    HEADERS = ("Extension", "Category", "Description", "Type", "Active", "Created", "Actions")
+    SEARCH_FIELDS = ('extension', 'description')
+    COLUMN_WIDTHS = (90, 140, 300, 140, 60, 90, 80)
+    # Type column text keyed by the (archive, disc, auxiliary) flags
+    TYPE_LABELS = {
+        flags: ", ".join(name for name, flag in zip(("Archive", "Disc", "Auxiliary"), flags) if flag) or "ROM"
+        for flags in product((False, True), repeat=3)
+    }
+
+    def display_text(self, record: Dict[str, Any], column: int) -> str:
+        if column == 0:
+            return record['extension']
+        if column == 1:
+            return record['category_name']
+        if column == 2:
+            return record['description'] or ""
+        if column == 3:
+            return self.TYPE_LABELS[
+                bool(record['treat_as_archive']),
+                bool(record['treat_as_disc']),
+                bool(record['treat_as_auxiliary']),
+            ]
+        if column == 4:
+            return "Yes" if record['is_active'] else "No"
+        if column == 5:
+            return (record['created_at'] or "")[:10]
+        return ""
+
+    def decoration(self, record: Dict[str, Any], column: int) -> Optional[str]:
+        if column == 4:
+            return "✅" if record['is_active'] else "❌"
+        return None
+
+    def row_key(self, record: Dict[str, Any]) -> str:
+        return record['extension']
+
+
+class MappingsTableModel(RegistryTableModel):
+    """Table model for the platform mappings tab."""
+
+    HEADERS = ("Platform", "Extension", "Category", "Primary", "Actions")
+    COLUMN_WIDTHS = (260, 100, 180, 70, 80)
+    # Indexed by is_primary
+    PRIMARY_ICONS = ('📄', '⭐')
+
+    def display_text(self, record: Dict[str, Any], column: int) -> str:
+        if column == 0:
+            return record['platform_name']
+        if column == 1:
+            return record['extension']
+        if column == 2:
+            return record['category_name']
+        if column == 3:
+            return "Yes" if record['is_primary'] else "No"
+        return ""
+
+    def decoration(self, record: Dict[str, Any], column: int) -> Optional[str]:
+        if column == 3:
+            return self.PRIMARY_ICONS[bool(record['is_primary'])]
+        return None
+
+    def row_key(self, record: Dict[str, Any]) -> Tuple[int, str]:
+        return record['platform_id'], record['extension']
+
+
+class UnknownExtensionsTableModel(RegistryTableModel):
+    """Table model for the unknown extensions tab."""
+
+    HEADERS = (
+        "Extension", "File Count", "Status", "First Seen",
+        "Suggested Category", "Suggested Platform", "Actions"
+    )
+    SEARCH_FIELDS = ('extension',)
+    COLUMN_WIDTHS = (90, 80, 110, 90, 150, 150, 120)
+    STATUS_ICONS = {
+        'pending': '🟡',
+        'approved': '✅',
+        'rejected': '❌',
+        'ignored': '⚪'
+    }
+
+    def display_text(self, record: Dict[str, Any], column: int) -> str:
+        if column == 0:
+            return record['extension']
+        if column == 1:
+            return str(record['file_count'])
+        if column == 2:
+            return record['status'].title()
+        if column == 3:
+            return (record['first_seen'] or "")[:10]
+        if column == 4:
+            return record['suggested_category'] or ""
+        if column == 5:
+            return record['suggested_platform'] or ""
+        return ""
+
+    def decoration(self, record: Dict[str, Any], column: int) -> Optional[str]:
+        if column == 2:
+            return self.STATUS_ICONS.get(record['status'], '❓')
+        return None
+
+    def row_key(self, record: Dict[str, Any]) -> int:
+        return record['unknown_extension_id']
+
+
+class RegistryFilterProxy(QSortFilterProxyModel):
+    """Filter a registry model by its search keys.
+
+    Rows are accepted on the pre-lowered ``search_key`` of the source model, so no
+    display text has to be formatted to decide whether a row is visible.
+    """
+
+    def __init__(self, source: RegistryTableModel, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self._search_text = ""
+
+    def set_search_text(self, text: str):
+        """Show only rows whose search key contains ``text`` (case-insensitive)."""
+        text = text.lower()
+        if text != self._search_text:
+            self._search_text = text
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return not self._search_text or self._search_text in self.sourceModel().search_key(source_row)
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """Paints inline action buttons for a table column and reports clicks.
+
+    Replaces per-row ``QPushButton`` cell widgets: the buttons are drawn with the
+    current style and clicks are resolved in ``editorEvent``. The row key comes from
+    ``Qt.UserRole`` on the clicked index.
+    """
+
+    actionTriggered = pyqtSignal(str, object)
+
+    def __init__(self, actions: List[Tuple[str, str, str]], parent=None):
+        """Create the delegate from ``(action, label, tooltip)`` tuples."""
+        super().__init__(parent)
+        self._actions = tuple(actions)
+
+    def _button_rects(self, rect: QRect) -> List[QRect]:
+        """Split a cell rectangle into one button rectangle per action."""
+        width = rect.width() // len(self._actions)
+        return [
+            QRect(rect.x() + i * width, rect.y(), width, rect.height()).adjusted(2, 2, -2, -2)
+            for i in range(len(self._actions))
+        ]
+
+    def _action_at(self, rect: QRect, pos: QPoint) -> Optional[Tuple[str, str, str]]:
+        """Return the action whose button contains ``pos``."""
+        for action, button_rect in zip(self._actions, self._button_rects(rect)):
+            if button_rect.contains(pos):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        """Draw the action buttons for the cell."""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        for (_, label, _), rect in zip(self._actions, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        """Emit ``actionTriggered`` when a painted button is clicked."""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if action := self._action_at(option.rect, event.pos()):
+                self.actionTriggered.emit(action[0], index.data(Qt.UserRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        """Show the tooltip of the hovered button."""
+        if event.type() == QEvent.ToolTip:
+            if action := self._action_at(option.rect, event.pos()):
+                QToolTip.showText(event.globalPos(), action[2], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class RegistryLoadWorker(QThread):
+    """Worker thread that reads one registry dataset without blocking the GUI."""
+    
+    loaded = pyqtSignal(str, list)  # dataset, rows
+    error = pyqtSignal(str, str)    # dataset, error message
+    
+    QUERIES: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
+        'categories': lambda manager: manager.get_categories(active_only=False),
+        'extensions': lambda manager, **filters: manager.get_extensions(active_only=False, **filters),
+        'mappings': lambda manager, **filters: manager.get_platform_extensions(**filters),
+        'unknown': lambda manager, **filters: manager.get_unknown_extensions(**filters),
+    }
+    
+    def __init__(self, manager: ExtensionRegistryManager, dataset: str,
+                 filters: Optional[Dict[str, Any]] = None, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.dataset = dataset
+        self.filters = filters or {}
+    
+    def run(self):
+        try:
+            rows = self.QUERIES[self.dataset](self.manager, **self.filters)
+            self.loaded.emit(self.dataset, rows)
+        except Exception as e:
+            self.error.emit(self.dataset, str(e))
+
+
+class RegistryTransferWorker(QThread):
+    """Worker thread that imports or exports the registry file without blocking the GUI."""
+    
+    completed = pyqtSignal(str, object)  # operation, manager result
+    error = pyqtSignal(str, str)         # operation, error message
+    
+    def __init__(self, db_path: str, operation: str, file_path: str, format: str,
+                 overwrite: bool = False, use_wal: bool = True, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.operation = operation
+        self.file_path = file_path
+        self.format = format
+        self.overwrite = overwrite
+        self.use_wal = use_wal
+    
+    def run(self):
+        try:
+            # A private manager, because an import or export holds its connection's
+            # lock for the whole transaction and the dialog's reads must not wait on it
+            manager = ExtensionRegistryManager(self.db_path, use_wal=self.use_wal)
+            try:
+                if self.operation == 'import':
+                    result = manager.import_extensions(self.file_path, self.format, self.overwrite)
+                else:
+                    result = manager.export_extensions(self.file_path, self.format)
+            finally:
+                manager.close()
+            self.completed.emit(self.operation, result)
+        except Exception as e:
+            self.error.emit(self.operation, str(e))
+
+
 class ExtensionRegistryDialog(QDialog):
-    """Main extension registry management dialog."""
+    """Main extension registry management dialog.
+    
+    The parent's stylesheet already cascades to this dialog, so it is not
+    copied onto it; the title bar gets a single stylesheet of its own.
+    """
+    
+    TITLE_BAR_STYLE = """
+        QWidget {
+            background-color: #2b2b2b;
+            border-bottom: 1px solid #555;
+        }
+        QLabel {
+            color: white;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton {
+            background-color: #e74c3c;
+            color: white;
+            border: none;
+            border-radius: 10px;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        QPushButton:hover {
+            background-color: #c0392b;
+        }
+        QPushButton:pressed {
+            background-color: #a93226;
+        }
+    """
     
     def __init__(self, db_path: str, parent=None):
         super().__init__(parent)
         self.db_path = db_path
         self.manager = ExtensionRegistryManager(db_path)
+        # QDialog.closeEvent rejects a visible dialog, so closing from the title bar
+        # or window manager also emits finished and releases resources
+        self.finished.connect(self._release_resources)
+        
+        # Pending filter and reload delays, cancelled when the dialog closes
+        self._filter_timers: List[QTimer] = []
+        
+        # Latest worker per dataset; results from superseded workers are dropped
+        self._load_workers: Dict[str, RegistryLoadWorker] = {}
+        self._running_workers: List[RegistryLoadWorker] = []
+        # Status bar notice to show once the running loads finish
+        self._idle_message: Optional[str] = None
         self.current_category_id = None
         self.current_extension = None
+        self._stats_version = None
+        
+        # Categories keyed by id, valid while the manager's data version matches
+        self._categories_by_id: Dict[int, Dict[str, Any]] = {}
+        self._categories_version: Optional[int] = None
+        self._categories_requested_version: Optional[int] = None
+        
+        # Platform and extension choices for the add/approve dialogs, as (version, rows)
+        self._lookup_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        
+        # Query filters of the paged datasets, reused to fetch their later pages
+        self._page_filters: Dict[str, Dict[str, Any]] = {}
+        
+        # Choices currently in the filter combos, to skip no-op rebuilds
+        self._category_filter_choices: Optional[Tuple[Tuple[int, str], ...]] = None
+        self._platform_filter_choices: Optional[Tuple[Tuple[int, str], ...]] = None
+        
+        # Approval prompt, built on first use and reused by every approval
+        self._approval_dialog: Optional[QDialog] = None
+        self._approval_choices: Tuple[Any, Any] = (None, None)
         
         self.setWindowTitle("Extension Registry Manager")
         self.setModal(True)
@@ -69,12 +665,20 @@ class ExtensionRegistryDialog(QDialog):
         # Make frameless to avoid white Windows title bar
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         
-        # Inherit parent's stylesheet if available
-        if parent and hasattr(parent, 'styleSheet'):
-            self.setStyleSheet(parent.styleSheet())
-        
         self.init_ui()
-        self.load_data()
+        
+        # Each tab's dataset is queried the first time the tab is shown
+        self._tab_loaders = {
+            0: self.load_categories,
+            1: self._load_extensions_tab,
+            2: self.load_mappings,
+            3: self.load_unknown_extensions,
+            4: self.refresh_statistics,
+        }
+        self._loaded = dict.fromkeys(self._tab_loaders, False)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        # Let the dialog frame paint before the first tab is built and queried
+        QTimer.singleShot(0, self._show_current_tab)
         
     def init_ui(self):
         """Initialize the user interface."""
@@ -86,35 +690,38 @@ class ExtensionRegistryDialog(QDialog):
         
         # Create tab widget for different sections
         tab_widget = QTabWidget()
+        self.tab_widget = tab_widget
         layout.addWidget(tab_widget)
         
-        # Categories tab
-        categories_tab = self.create_categories_tab()
-        tab_widget.addTab(categories_tab, "📁 Categories")
-        
-        # Extensions tab
-        extensions_tab = self.create_extensions_tab()
-        tab_widget.addTab(extensions_tab, "📄 Extensions")
-        
-        # Platform mappings tab
-        mappings_tab = self.create_mappings_tab()
-        tab_widget.addTab(mappings_tab, "🔗 Platform Mappings")
-        
-        # Unknown extensions tab
-        unknown_tab = self.create_unknown_tab()
-        tab_widget.addTab(unknown_tab, "❓ Unknown Extensions")
-        
-        # Statistics tab
-        stats_tab = self.create_statistics_tab()
-        tab_widget.addTab(stats_tab, "📊 Statistics")
-        
-        # Import/Export tab
-        import_export_tab = self.create_import_export_tab()
-        tab_widget.addTab(import_export_tab, "📤 Import/Export")
-        
-        # Bottom buttons
+        # Tabs start as empty pages; their contents are built when first shown
+        self._tab_factories = {
+            0: self.create_categories_tab,
+            1: self.create_extensions_tab,
+            2: self.create_mappings_tab,
+            3: self.create_unknown_tab,
+            4: self.create_statistics_tab,
+            5: self.create_import_export_tab,
+        }
+        self._materialised = set()
+        for title in (
+            "📁 Categories", "📄 Extensions", "🔗 Platform Mappings",
+            "❓ Unknown Extensions", "📊 Statistics", "📤 Import/Export",
+        ):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            tab_widget.addTab(page, title)
+        
+        # Bottom buttons, with background load progress on the left
         button_layout = QHBoxLayout()
-        button_layout.addStretch()
+        
+        self.status_bar = QStatusBar()
+        self.status_bar.setSizeGripEnabled(False)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setMaximumWidth(150)
+        self.progress_bar.setVisible(False)
+        self.status_bar.addPermanentWidget(self.progress_bar)
+        button_layout.addWidget(self.status_bar, 1)
         
         self.refresh_btn = QPushButton("🔄 Refresh")
         self.refresh_btn.clicked.connect(self.refresh_all_data)
@@ -131,25 +738,13 @@ class ExtensionRegistryDialog(QDialog):
         """Create a custom title bar with close button and drag functionality."""
         title_bar = DraggableTitleBar()
         title_bar.setFixedHeight(30)
-        title_bar.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                border-bottom: 1px solid #555;
-            }
-        """)
+        title_bar.setStyleSheet(self.TITLE_BAR_STYLE)
         
         layout = QHBoxLayout(title_bar)
         layout.setContentsMargins(10, 0, 10, 0)
         
         # Title
         title_label = QLabel("Extension Registry Manager")
-        title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-        """)
         layout.addWidget(title_label)
         
         # Spacer
@@ -158,22 +753,6 @@ class ExtensionRegistryDialog(QDialog):
         # Close button
         close_btn = QPushButton("×")
         close_btn.setFixedSize(20, 20)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
         
@@ -189,7 +768,8 @@ class ExtensionRegistryDialog(QDialog):
         
         self.category_search = QLineEdit()
         self.category_search.setPlaceholderText("Search categories...")
-        self.category_search.textChanged.connect(self.filter_categories)
+        self.category_search.textEdited.connect(self._schedule_category_filter)
+        self.category_filter_timer = self._create_filter_timer(self.filter_categories)
         controls_layout.addWidget(self.category_search)
         
         self.add_category_btn = QPushButton("➕ Add Category")
@@ -200,8 +780,14 @@ class ExtensionRegistryDialog(QDialog):
         layout.addLayout(controls_layout)
         
         # Categories list
-        self.categories_list = QListWidget()
-        self.categories_list.itemClicked.connect(self.on_category_selected)
+        self.categories_model = CategoriesListModel(self)
+        self.categories_proxy = QSortFilterProxyModel(self)
+        self.categories_proxy.setSourceModel(self.categories_model)
+        self.categories_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.categories_list = QListView()
+        self.categories_list.setModel(self.categories_proxy)
+        self.categories_list.setUniformItemSizes(True)
+        self.categories_list.selectionModel().currentChanged.connect(self.on_category_selected)
         self.categories_list.setAlternatingRowColors(True)
         layout.addWidget(self.categories_list)
         
@@ -212,8 +798,8 @@ class ExtensionRegistryDialog(QDialog):
         self.category_name_edit = QLineEdit()
         self.category_description_edit = QTextEdit()
         self.category_description_edit.setMaximumHeight(100)
-        self.category_sort_order_edit = QLineEdit()
-        self.category_sort_order_edit.setText("0")
+        self.category_sort_order_edit = QSpinBox()
+        self.category_sort_order_edit.setRange(0, 9999)
         self.category_active_check = QCheckBox("Active")
         self.category_active_check.setChecked(True)
         
@@ -251,12 +837,15 @@ class ExtensionRegistryDialog(QDialog):
         
         self.extension_search = QLineEdit()
         self.extension_search.setPlaceholderText("Search extensions...")
-        self.extension_search.textChanged.connect(self.filter_extensions)
+        self.extension_search.textEdited.connect(self._schedule_extension_filter)
+        self.extension_filter_timer = self._create_filter_timer(self.filter_extensions)
         controls_layout.addWidget(self.extension_search)
         
         self.category_filter = QComboBox()
         self.category_filter.addItem("All Categories")
-        self.category_filter.currentTextChanged.connect(self.filter_extensions)
+        # Keyboard stepping through the combo activates every entry; query once it settles
+        self.category_filter.activated[str].connect(self._schedule_extension_load)
+        self.extension_load_timer = self._create_filter_timer(self.load_extensions)
         controls_layout.addWidget(self.category_filter)
         
         self.add_extension_btn = QPushButton("➕ Add Extension")
@@ -267,14 +856,14 @@ class ExtensionRegistryDialog(QDialog):
         layout.addLayout(controls_layout)
         
         # Extensions table
-        self.extensions_table = QTableWidget()
-        self.extensions_table.setColumnCount(7)
-        self.extensions_table.setHorizontalHeaderLabels([
-            "Extension", "Category", "Description", "Type", "Active", "Created", "Actions"
-        ])
-        self.extensions_table.horizontalHeader().setStretchLastSection(True)
-        self.extensions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.extensions_table.itemSelectionChanged.connect(self.on_extension_selected)
+        self.extensions_model = ExtensionsTableModel(self)
+        self.extensions_model.fetchMoreRequested.connect(lambda: self._fetch_next_page('extensions'))
+        self.extensions_proxy = RegistryFilterProxy(self.extensions_model, self)
+        self.extensions_table = self._create_table_view(self.extensions_proxy)
+        self.extensions_table.selectionModel().selectionChanged.connect(self.on_extension_selected)
+        self.extension_actions = ActionDelegate([("edit", "Edit", "Edit extension")], self)
+        self.extension_actions.actionTriggered.connect(self._on_row_action, Qt.QueuedConnection)
+        self.extensions_table.setItemDelegateForColumn(6, self.extension_actions)
         layout.addWidget(self.extensions_table)
         
         return tab
@@ -289,7 +878,8 @@ class ExtensionRegistryDialog(QDialog):
         
         self.platform_filter = QComboBox()
         self.platform_filter.addItem("All Platforms")
-        self.platform_filter.currentTextChanged.connect(self.filter_mappings)
+        self.platform_filter.activated[str].connect(self._schedule_mapping_load)
+        self.mapping_load_timer = self._create_filter_timer(self.load_mappings)
         controls_layout.addWidget(self.platform_filter)
         
         self.add_mapping_btn = QPushButton("➕ Add Mapping")
@@ -300,13 +890,12 @@ class ExtensionRegistryDialog(QDialog):
         layout.addLayout(controls_layout)
         
         # Mappings table
-        self.mappings_table = QTableWidget()
-        self.mappings_table.setColumnCount(5)
-        self.mappings_table.setHorizontalHeaderLabels([
-            "Platform", "Extension", "Category", "Primary", "Actions"
-        ])
-        self.mappings_table.horizontalHeader().setStretchLastSection(True)
-        self.mappings_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.mappings_model = MappingsTableModel(self)
+        self.mappings_proxy = RegistryFilterProxy(self.mappings_model, self)
+        self.mappings_table = self._create_table_view(self.mappings_proxy)
+        self.mapping_actions = ActionDelegate([("delete", "Delete", "Delete mapping")], self)
+        self.mapping_actions.actionTriggered.connect(self._on_row_action, Qt.QueuedConnection)
+        self.mappings_table.setItemDelegateForColumn(4, self.mapping_actions)
         layout.addWidget(self.mappings_table)
         
         return tab
@@ -321,29 +910,98 @@ class ExtensionRegistryDialog(QDialog):
         
         self.unknown_search = QLineEdit()
         self.unknown_search.setPlaceholderText("Search unknown extensions...")
-        self.unknown_search.textChanged.connect(self.filter_unknown)
+        self.unknown_search.textEdited.connect(self._schedule_unknown_filter)
+        self.unknown_filter_timer = self._create_filter_timer(self.filter_unknown)
         controls_layout.addWidget(self.unknown_search)
         
         self.status_filter = QComboBox()
-        self.status_filter.addItems(["All Status", "Pending", "Approved", "Rejected", "Ignored"])
-        self.status_filter.currentTextChanged.connect(self.filter_unknown)
+        self.status_filter.addItem("All Status")
+        for status in ("pending", "approved", "rejected", "ignored"):
+            self.status_filter.addItem(status.title(), status)
+        self.status_filter.activated[str].connect(self._schedule_unknown_load)
+        self.unknown_load_timer = self._create_filter_timer(self.load_unknown_extensions)
         controls_layout.addWidget(self.status_filter)
         
+        self.approve_selected_btn = QPushButton("✅ Approve Selected")
+        self.approve_selected_btn.clicked.connect(self.approve_selected_unknown)
+        controls_layout.addWidget(self.approve_selected_btn)
+        
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
         
         # Unknown extensions table
-        self.unknown_table = QTableWidget()
-        self.unknown_table.setColumnCount(7)
-        self.unknown_table.setHorizontalHeaderLabels([
-            "Extension", "File Count", "Status", "First Seen", "Suggested Category", "Suggested Platform", "Actions"
-        ])
-        self.unknown_table.horizontalHeader().setStretchLastSection(True)
-        self.unknown_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.unknown_model = UnknownExtensionsTableModel(self)
+        self.unknown_model.fetchMoreRequested.connect(lambda: self._fetch_next_page('unknown'))
+        self.unknown_proxy = RegistryFilterProxy(self.unknown_model, self)
+        self.unknown_table = self._create_table_view(self.unknown_proxy)
+        self.unknown_actions = ActionDelegate([
+            ("approve", "✅", "Approve"),
+            ("reject", "❌", "Reject"),
+            ("ignore", "⚪", "Ignore"),
+        ], self)
+        self.unknown_actions.actionTriggered.connect(self._on_row_action, Qt.QueuedConnection)
+        self.unknown_table.setItemDelegateForColumn(6, self.unknown_actions)
         layout.addWidget(self.unknown_table)
         
         return tab
     
+    def _create_filter_timer(self, slot: Callable[[], None]) -> QTimer:
+        """Create a single-shot timer that runs a filter once typing pauses."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(FILTER_DELAY_MS)
+        timer.timeout.connect(slot)
+        self._filter_timers.append(timer)
+        return timer
+    
+    def _stop_filter_timers(self):
+        """Drop pending filter passes so none fire after the dialog closes."""
+        for timer in self._filter_timers:
+            timer.stop()
+    
+    def _schedule_category_filter(self):
+        """Restart the category filter delay after a user edit."""
+        self.category_filter_timer.start()
+    
+    def _schedule_extension_filter(self):
+        """Restart the extension filter delay after a user edit."""
+        self.extension_filter_timer.start()
+    
+    def _schedule_extension_load(self):
+        """Restart the extension reload delay after a category change."""
+        self.extension_load_timer.start()
+    
+    def _schedule_mapping_load(self):
+        """Restart the mapping reload delay after a platform change."""
+        self.mapping_load_timer.start()
+    
+    def _schedule_unknown_load(self):
+        """Restart the unknown extension reload delay after a status change."""
+        self.unknown_load_timer.start()
+    
+    def _schedule_unknown_filter(self):
+        """Restart the unknown extension filter delay after a user edit."""
+        self.unknown_filter_timer.start()
+    
+    def _create_table_view(self, proxy: RegistryFilterProxy) -> QTableView:
+        """Create a row-selecting table view showing a registry model through its filter proxy."""
+        table = QTableView()
+        table.setModel(proxy)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setWordWrap(False)
+        table.setTextElideMode(Qt.ElideRight)
+        
+        # Fixed geometry keeps layout independent of the number of rows
+        vertical_header = table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(ROW_HEIGHT)
+        horizontal_header = table.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal_header.setStretchLastSection(True)
+        for column, width in enumerate(proxy.sourceModel().COLUMN_WIDTHS):
+            table.setColumnWidth(column, width)
+        return table
+    
     def create_statistics_tab(self):
         """Create the statistics tab."""
         tab = QWidget()
@@ -368,14 +1026,16 @@ class ExtensionRegistryDialog(QDialog):
         layout = QVBoxLayout(tab)
         
         # Export section
-        export_group = self._create_button_group("Export Extension Registry", [
+        self.export_group = export_group = QGroupBox("Export Extension Registry")
+        export_layout = QVBoxLayout(export_group)
+        export_layout.addLayout(self._create_button_layout([
             ("📄 Export JSON", lambda: self.export_data('json')),
             ("📊 Export CSV", lambda: self.export_data('csv'))
-        ])
+        ]))
         layout.addWidget(export_group)
         
         # Import section
-        import_group = QGroupBox("Import Extension Registry")
+        self.import_group = import_group = QGroupBox("Import Extension Registry")
         import_layout = QVBoxLayout(import_group)
         
         import_buttons_layout = self._create_button_layout([
@@ -408,17 +1068,8 @@ class ExtensionRegistryDialog(QDialog):
         
         return tab
     
-    def _create_button_group(self, title: str, buttons: List[Tuple[str, callable]]) -> QGroupBox:
-        """Create a group box with buttons."""
-        group = QGroupBox(title)
-        layout = QVBoxLayout(group)
-        
-        button_layout = self._create_button_layout(buttons)
-        layout.addLayout(button_layout)
-        
-        return group
-    
-    def _create_button_layout(self, buttons: List[Tuple[str, callable]]) -> QHBoxLayout:
+    @staticmethod
+    def _create_button_layout(buttons: List[Tuple[str, Callable[[], None]]]) -> QHBoxLayout:
         """Create a horizontal layout with buttons."""
         layout = QHBoxLayout()
         
@@ -431,200 +1082,365 @@ class ExtensionRegistryDialog(QDialog):
         return layout
     
     def load_data(self):
-        """Load all data from the database."""
-        self.load_categories()
-        self.load_extensions()
-        self.load_mappings()
-        self.load_unknown_extensions()
-        self.refresh_statistics()
+        """Mark every tab stale and reload the visible one."""
+        self._invalidate_tabs(*self._loaded)
+    
+    def _show_current_tab(self):
+        """Build and load whichever tab is current."""
+        self._on_tab_changed(self.tab_widget.currentIndex())
+    
+    def _on_tab_changed(self, index: int):
+        """Build and load a tab as it is shown."""
+        self._materialise_tab(index)
+        self._ensure_tab_loaded(index)
+    
+    def _materialise_tab(self, index: int):
+        """Create a tab's widgets inside its placeholder page on first use."""
+        if index in self._materialised or index not in self._tab_factories:
+            return
+        
+        self.tab_widget.widget(index).layout().addWidget(self._tab_factories[index]())
+        self._materialised.add(index)
+    
+    def _ensure_tab_loaded(self, index: int):
+        """Load a tab's data the first time it is shown or after invalidation."""
+        if index in self._loaded and not self._loaded[index]:
+            self._tab_loaders[index]()
+            self._loaded[index] = True
+    
+    def _invalidate_tabs(self, *indexes: int):
+        """Mark tabs stale; the visible one reloads now, the rest when shown."""
+        for index in indexes:
+            self._loaded[index] = False
+        self._ensure_tab_loaded(self.tab_widget.currentIndex())
+    
+    def _start_load(self, dataset: str, **filters):
+        """Read a dataset on a worker thread; the matching ``_populate_*`` applies it."""
+        worker = RegistryLoadWorker(self.manager, dataset, filters, self)
+        worker.loaded.connect(self._on_rows_loaded)
+        worker.error.connect(self._on_load_error)
+        worker.finished.connect(lambda: self._on_load_finished(worker))
+        self._load_workers[dataset] = worker
+        self._running_workers.append(worker)
+        
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage(f"Loading {dataset}...")
+        worker.start()
+    
+    def _on_rows_loaded(self, dataset: str, rows: List[Dict[str, Any]]):
+        """Apply rows from the newest worker for a dataset."""
+        worker = self.sender()
+        if worker is not self._load_workers.get(dataset):
+            return
+        
+        if worker.filters.get('offset'):
+            self._paged_model(dataset).append_rows(rows, has_more=len(rows) == PAGE_SIZE)
+            return
+        
+        populate = {
+            'categories': self._populate_categories,
+            'extensions': self._populate_extensions,
+            'mappings': self._populate_mappings,
+            'unknown': self._populate_unknown_extensions,
+        }[dataset]
+        populate(rows)
+    
+    def _on_load_error(self, dataset: str, error: str):
+        """Report a failed background load."""
+        worker = self.sender()
+        if worker is self._load_workers.get(dataset):
+            if worker.filters.get('offset'):
+                self._paged_model(dataset).cancel_fetch()
+            QMessageBox.critical(self, "Error", f"Failed to load {dataset}: {error}")
+    
+    def _on_load_finished(self, worker: RegistryLoadWorker):
+        """Release a finished load worker."""
+        if self._load_workers.get(worker.dataset) is worker:
+            del self._load_workers[worker.dataset]
+        self._release_worker(worker)
+    
+    def _release_worker(self, worker: QThread):
+        """Forget a finished worker and hide the progress bar when idle."""
+        self._running_workers.remove(worker)
+        worker.deleteLater()
+        
+        if not self._running_workers:
+            self.progress_bar.setVisible(False)
+            self._show_idle_message()
+    
+    def _show_idle_message(self):
+        """Flash the pending notice, if any, in place of the loading message."""
+        if self._idle_message:
+            self.status_bar.showMessage(self._idle_message, STATUS_MESSAGE_MS)
+            self._idle_message = None
+        else:
+            self.status_bar.clearMessage()
+    
+    def _wait_for_loads(self):
+        """Block until background loads finish so no thread outlives the dialog."""
+        for worker in list(self._running_workers):
+            worker.wait()
+    
+    def _release_resources(self):
+        """Stop timers, wait for loads, then close the registry connection.
+        
+        Runs on ``finished``, which every close path emits.
+        """
+        self._stop_filter_timers()
+        # Let running loads finish before the registry is closed and optimized
+        self._wait_for_loads()
+        self.manager.close()
     
     def load_categories(self):
         """Load categories into the list."""
-        self.categories_list.clear()
-        categories = self.manager.get_categories(active_only=False)
-        
-        for category in categories:
-            status_icon = "✅" if category['is_active'] else "❌"
-            item_text = f"{status_icon} {category['name']}"
-            if category['description']:
-                item_text += f" - {category['description']}"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, category['category_id'])
-            self.categories_list.addItem(item)
+        self._categories_requested_version = self.manager.data_version
+        self._start_load('categories')
+    
+    def _cache_categories(self, categories: List[Dict[str, Any]], data_version: Optional[int]):
+        """Remember categories for lookups until the registry changes."""
+        self._categories_by_id = {category['category_id']: category for category in categories}
+        self._categories_version = data_version
+    
+    def _get_categories(self, active_only: bool = False) -> List[Dict[str, Any]]:
+        """Return categories from the cache, refetching if the registry changed."""
+        if self._categories_version != self.manager.data_version:
+            self._cache_categories(
+                self.manager.get_categories(active_only=False), self.manager.data_version
+            )
         
-        # Update category filter in extensions tab
-        self.category_filter.clear()
-        self.category_filter.addItem("All Categories")
-        for category in categories:
-            if category['is_active']:
-                self.category_filter.addItem(category['name'])
+        categories = self._categories_by_id.values()
+        if active_only:
+            return [category for category in categories if category['is_active']]
+        return list(categories)
     
-    def load_extensions(self):
-        """Load extensions into the table."""
-        extensions = self.manager.get_extensions(active_only=False)
+    def _cached_lookup(self, name: str, fetch: Callable[[], List[Any]]) -> List[Any]:
+        """Return a cached lookup list, refetching it if the registry changed."""
+        version, rows = self._lookup_cache.get(name, (None, None))
+        if version != self.manager.data_version:
+            rows = fetch()
+            self._lookup_cache[name] = (self.manager.data_version, rows)
+        return rows
+    
+    def _get_platforms(self) -> List[Dict[str, Any]]:
+        """Return all platforms ordered by name."""
+        return self._cached_lookup('platforms', self.manager.get_platforms)
+    
+    def _get_active_extensions(self) -> List[Dict[str, Any]]:
+        """Return the active extensions offered for new mappings."""
+        return self._cached_lookup(
+            'active_extensions', lambda: self.manager.get_extensions(active_only=True)
+        )
+    
+    def _category_choices(self, active_only: bool = False) -> List[Tuple[str, int]]:
+        """Return cached ``(name, category_id)`` combo choices."""
+        return self._cached_lookup(
+            'active_category_choices' if active_only else 'category_choices',
+            lambda: [
+                (category['name'], category['category_id'])
+                for category in self._get_categories(active_only=active_only)
+            ],
+        )
+    
+    def _platform_choices(self) -> List[Tuple[str, int]]:
+        """Return cached ``(name, platform_id)`` combo choices."""
+        return self._cached_lookup(
+            'platform_choices',
+            lambda: [(platform['name'], platform['platform_id']) for platform in self._get_platforms()],
+        )
+    
+    def _populate_categories(self, categories: List[Dict[str, Any]]):
+        """Fill the categories list and the extensions category filter."""
+        self._cache_categories(categories, self._categories_requested_version)
         
-        self.extensions_table.setRowCount(len(extensions))
+        with _batched_updates(self.categories_list):
+            self.categories_model.set_rows(categories)
         
-        for row, ext in enumerate(extensions):
-            # Extension
-            self.extensions_table.setItem(row, 0, QTableWidgetItem(ext['extension']))
-            
-            # Category
-            self.extensions_table.setItem(row, 1, QTableWidgetItem(ext['category_name']))
-            
-            # Description
-            desc = ext['description'] or ""
-            self.extensions_table.setItem(row, 2, QTableWidgetItem(desc))
-            
-            # Type
-            types = []
-            if ext['treat_as_archive']:
-                types.append("Archive")
-            if ext['treat_as_disc']:
-                types.append("Disc")
-            if ext['treat_as_auxiliary']:
-                types.append("Auxiliary")
-            type_text = ", ".join(types) if types else "ROM"
-            self.extensions_table.setItem(row, 3, QTableWidgetItem(type_text))
-            
-            # Active
-            active_icon = "✅" if ext['is_active'] else "❌"
-            self.extensions_table.setItem(row, 4, QTableWidgetItem(active_icon))
-            
-            # Created
-            created = ext['created_at'][:10] if ext['created_at'] else ""
-            self.extensions_table.setItem(row, 5, QTableWidgetItem(created))
-            
-            # Actions
-            actions_btn = QPushButton("Edit")
-            actions_btn.clicked.connect(lambda checked, ext_id=ext['extension']: self.edit_extension(ext_id))
-            self.extensions_table.setCellWidget(row, 6, actions_btn)
+        self._rebuild_category_filter()
     
-    def load_mappings(self):
-        """Load platform mappings into the table."""
-        mappings = self.manager.get_platform_extensions()
+    def _rebuild_category_filter(self):
+        """Update the category filter in the extensions tab from the cache."""
+        if 1 not in self._materialised:
+            return
         
-        self.mappings_table.setRowCount(len(mappings))
+        choices = tuple(
+            (category['category_id'], category['name'])
+            for category in self._categories_by_id.values()
+            if category['is_active']
+        )
+        if choices == self._category_filter_choices:
+            return
         
-        for row, mapping in enumerate(mappings):
-            # Platform
-            self.mappings_table.setItem(row, 0, QTableWidgetItem(mapping['platform_name']))
-
-            # Extension
-            self.mappings_table.setItem(row, 1, QTableWidgetItem(mapping['extension']))
-
-            # Category
-            self.mappings_table.setItem(row, 2, QTableWidgetItem(mapping['category_name']))
-
-            # Primary
-            primary_icon = "⭐" if mapping['is_primary'] else "📄"
-            self.mappings_table.setItem(row, 3, QTableWidgetItem(primary_icon))
-
-            # Actions
-            actions_btn = QPushButton("Delete")
-            actions_btn.clicked.connect(
-                lambda _=False, pid=mapping['platform_id'], ext=mapping['extension']: self.delete_mapping(pid, ext)
-            )
-            self.mappings_table.setCellWidget(row, 4, actions_btn)
+        selected_id = self.category_filter.currentData()
+        self.category_filter.blockSignals(True)
+        self.category_filter.clear()
+        self.category_filter.addItem("All Categories", None)
+        # Keep the selection; the extension rows were loaded for it
+        _fill_combo(self.category_filter, ((name, category_id) for category_id, name in choices), selected_id)
+        self.category_filter.blockSignals(False)
+        self._category_filter_choices = choices
+        if selected_id is not None and self.category_filter.currentData() != selected_id:
+            self.load_extensions()
     
-    def load_unknown_extensions(self):
-        """Load unknown extensions into the table."""
-        unknown = self.manager.get_unknown_extensions()
-        
-        self.unknown_table.setRowCount(len(unknown))
+    def _rebuild_platform_filter(self, mappings: Iterable[Dict[str, Any]]):
+        """Offer the platforms that have mappings in the platform filter."""
+        # Rows added in place are appended, so order by name here
+        choices = tuple(sorted(
+            {(mapping['platform_id'], mapping['platform_name']) for mapping in mappings},
+            key=lambda choice: choice[1],
+        ))
+        if choices == self._platform_filter_choices:
+            return
         
-        for row, ext in enumerate(unknown):
-            # Extension
-            self.unknown_table.setItem(row, 0, QTableWidgetItem(ext['extension']))
-            
-            # File count
-            self.unknown_table.setItem(row, 1, QTableWidgetItem(str(ext['file_count'])))
-            
-            # Status
-            status_icon = {
-                'pending': '🟡',
-                'approved': '✅',
-                'rejected': '❌',
-                'ignored': '⚪'
-            }.get(ext['status'], '❓')
-            status_text = f"{status_icon} {ext['status'].title()}"
-            self.unknown_table.setItem(row, 2, QTableWidgetItem(status_text))
-            
-            # First seen
-            first_seen = ext['first_seen'][:10] if ext['first_seen'] else ""
-            self.unknown_table.setItem(row, 3, QTableWidgetItem(first_seen))
-            
-            # Suggested category
-            suggested_cat = ext['suggested_category'] or ""
-            self.unknown_table.setItem(row, 4, QTableWidgetItem(suggested_cat))
-            
-            # Suggested platform
-            suggested_plat = ext['suggested_platform'] or ""
-            self.unknown_table.setItem(row, 5, QTableWidgetItem(suggested_plat))
-            
-            # Actions
-            actions_layout = QHBoxLayout()
-            approve_btn = QPushButton("✅")
-            approve_btn.setToolTip("Approve")
-            approve_btn.clicked.connect(lambda checked, ext_id=ext['unknown_extension_id']: self.approve_unknown(ext_id))
-            actions_layout.addWidget(approve_btn)
-            
-            reject_btn = QPushButton("❌")
-            reject_btn.setToolTip("Reject")
-            reject_btn.clicked.connect(lambda checked, ext_id=ext['unknown_extension_id']: self.reject_unknown(ext_id))
-            actions_layout.addWidget(reject_btn)
-            
-            ignore_btn = QPushButton("⚪")
-            ignore_btn.setToolTip("Ignore")
-            ignore_btn.clicked.connect(lambda checked, ext_id=ext['unknown_extension_id']: self.ignore_unknown(ext_id))
-            actions_layout.addWidget(ignore_btn)
-            
-            actions_widget = QWidget()
-            actions_widget.setLayout(actions_layout)
-            self.unknown_table.setCellWidget(row, 6, actions_widget)
+        selected = self.platform_filter.currentData()
+        self.platform_filter.blockSignals(True)
+        self.platform_filter.clear()
+        self.platform_filter.addItem("All Platforms")
+        _fill_combo(self.platform_filter, ((name, platform_id) for platform_id, name in choices), selected)
+        self.platform_filter.blockSignals(False)
+        self._platform_filter_choices = choices
+    
+    def _load_extensions_tab(self):
+        """Load the category filter choices and the extensions table."""
+        if self._categories_version == self.manager.data_version:
+            self._rebuild_category_filter()
+        else:
+            self.load_categories()
+        self.load_extensions()
+    
+    def load_extensions(self):
+        """Load the first page of extensions matching the category and search."""
+        self._start_page_load(
+            'extensions',
+            category_id=self.category_filter.currentData(),
+            search=self.extension_search.text() or None,
+        )
+    
+    def _populate_extensions(self, extensions: List[Dict[str, Any]]):
+        """Replace the extensions table contents."""
+        with _batched_updates(self.extensions_table):
+            self.extensions_model.set_rows(extensions, has_more=len(extensions) == PAGE_SIZE)
+    
+    def load_mappings(self):
+        """Load the mappings of the selected platform into the table."""
+        self._start_load('mappings', platform_id=self.platform_filter.currentData())
+    
+    def _populate_mappings(self, mappings: List[Dict[str, Any]]):
+        """Replace the platform mappings table contents."""
+        with _batched_updates(self.mappings_table):
+            self.mappings_model.set_rows(mappings)
+        # Only an unfiltered load lists every platform that has mappings
+        if self.platform_filter.currentData() is None:
+            self._rebuild_platform_filter(mappings)
+    
+    def load_unknown_extensions(self):
+        """Load unknown extensions with the selected status into the table."""
+        self._start_page_load(
+            'unknown',
+            status=self.status_filter.currentData(),
+            search=self.unknown_search.text() or None,
+        )
+    
+    def _populate_unknown_extensions(self, unknown_extensions: List[Dict[str, Any]]):
+        """Replace the unknown extensions table contents."""
+        with _batched_updates(self.unknown_table):
+            self.unknown_model.set_rows(
+                unknown_extensions, has_more=len(unknown_extensions) == PAGE_SIZE
+            )
+    
+    def _paged_model(self, dataset: str) -> RegistryTableModel:
+        """Return the model that shows a paged dataset."""
+        return {'extensions': self.extensions_model, 'unknown': self.unknown_model}[dataset]
+    
+    def _start_page_load(self, dataset: str, **filters):
+        """Load the first page of a paged dataset; later pages follow on scroll."""
+        self._page_filters[dataset] = filters
+        self._start_load(dataset, limit=PAGE_SIZE, offset=0, **filters)
+    
+    def _fetch_next_page(self, dataset: str):
+        """Load the page after the rows a paged model already holds."""
+        model = self._paged_model(dataset)
+        if dataset in self._load_workers:
+            # A reload is on its way and replaces the rows anyway
+            model.cancel_fetch()
+            return
+        self._start_load(
+            dataset, limit=PAGE_SIZE, offset=model.fetched_count, **self._page_filters[dataset]
+        )
+    
+    def _search_needs_query(self, dataset: str, search: str) -> bool:
+        """Whether a new search text must be sent to SQL rather than only the proxy.
+        
+        Narrowing the search over a fully loaded result only hides rows, which the
+        filter proxy already does.
+        """
+        previous = self._page_filters.get(dataset, {}).get('search') or ""
+        return not (self._paged_model(dataset).is_complete and previous.lower() in search.lower())
+    
+    def _on_row_action(self, action: str, key: Any):
+        """Dispatch an action clicked in any registry table to its handler."""
+        handlers = {
+            'edit': self.edit_extension,
+            'delete': lambda mapping_key: self.delete_mapping(*mapping_key),
+            'approve': self.approve_unknown,
+            'reject': self.reject_unknown,
+            'ignore': self.ignore_unknown,
+        }
+        if handler := handlers.get(action):
+            handler(key)
     
     def refresh_statistics(self):
-        """Refresh the statistics display."""
+        """Refresh the statistics display unless the registry is unchanged."""
+        if self._stats_version == self.manager.data_version:
+            return
+        
         summary = self.manager.get_extension_registry_summary()
         
-        stats_text = "📊 EXTENSION REGISTRY STATISTICS\n"
-        stats_text += "=" * 50 + "\n\n"
-        
-        # Categories
-        stats_text += "📁 CATEGORIES\n"
-        stats_text += f"   Total: {summary['categories']['total_categories']}\n"
-        stats_text += f"   Active: {summary['categories']['active_categories']}\n\n"
-        
-        # Extensions
-        stats_text += "📄 EXTENSIONS\n"
-        stats_text += f"   Total: {summary['extensions']['total_extensions']}\n"
-        stats_text += f"   Active: {summary['extensions']['active_extensions']}\n"
-        stats_text += f"   ROM: {summary['extensions']['rom_extensions']}\n"
-        stats_text += f"   Archive: {summary['extensions']['archive_extensions']}\n"
-        stats_text += f"   Disc: {summary['extensions']['disc_extensions']}\n"
-        stats_text += f"   Auxiliary: {summary['extensions']['auxiliary_extensions']}\n\n"
-        
-        # Mappings
-        stats_text += "🔗 PLATFORM MAPPINGS\n"
-        stats_text += f"   Total: {summary['mappings']['total_mappings']}\n"
-        stats_text += f"   Primary: {summary['mappings']['primary_mappings']}\n"
-        stats_text += f"   Platforms: {summary['mappings']['platforms_with_mappings']}\n\n"
-        
-        # Unknown
-        stats_text += "❓ UNKNOWN EXTENSIONS\n"
-        stats_text += f"   Total: {summary['unknown']['total_unknown']}\n"
-        stats_text += f"   Pending: {summary['unknown']['pending_unknown']}\n"
-        stats_text += f"   Approved: {summary['unknown']['approved_unknown']}\n"
-        stats_text += f"   Rejected: {summary['unknown']['rejected_unknown']}\n"
-        stats_text += f"   Ignored: {summary['unknown']['ignored_unknown']}\n"
-        
-        self.stats_text.setText(stats_text)
+        categories = summary['categories']
+        extensions = summary['extensions']
+        mappings = summary['mappings']
+        unknown = summary['unknown']
+        
+        lines = [
+            "📊 EXTENSION REGISTRY STATISTICS",
+            "=" * 50,
+            "",
+            "📁 CATEGORIES",
+            f"   Total: {categories['total_categories']}",
+            f"   Active: {categories['active_categories']}",
+            "",
+            "📄 EXTENSIONS",
+            f"   Total: {extensions['total_extensions']}",
+            f"   Active: {extensions['active_extensions']}",
+            f"   ROM: {extensions['rom_extensions']}",
+            f"   Archive: {extensions['archive_extensions']}",
+            f"   Disc: {extensions['disc_extensions']}",
+            f"   Auxiliary: {extensions['auxiliary_extensions']}",
+            "",
+            "🔗 PLATFORM MAPPINGS",
+            f"   Total: {mappings['total_mappings']}",
+            f"   Primary: {mappings['primary_mappings']}",
+            f"   Platforms: {mappings['platforms_with_mappings']}",
+            "",
+            "❓ UNKNOWN EXTENSIONS",
+            f"   Total: {unknown['total_unknown']}",
+            f"   Pending: {unknown['pending_unknown']}",
+            f"   Approved: {unknown['approved_unknown']}",
+            f"   Rejected: {unknown['rejected_unknown']}",
+            f"   Ignored: {unknown['ignored_unknown']}",
+            "",
+        ]
+        
+        # Plain text skips the rich-text parser that setText would run
+        self.stats_text.setPlainText("\n".join(lines))
+        self._stats_version = self.manager.data_version
     
     def refresh_all_data(self):
         """Refresh all data in all tabs."""
+        self.manager.invalidate_caches()
+        self._idle_message = "All data has been refreshed."
         self.load_data()
-        QMessageBox.information(self, "Refresh Complete", "All data has been refreshed.")
+        if not self._running_workers:
+            self._show_idle_message()
     
     # =============================================================================
     # MISSING GUI METHODS - IMPLEMENTATION
@@ -632,8 +1448,6 @@ class ExtensionRegistryDialog(QDialog):
     
     def add_extension(self):
         """Add a new file extension."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QComboBox, QCheckBox, QPushButton, QDialogButtonBox
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Extension")
         dialog.setModal(True)
@@ -649,9 +1463,7 @@ class ExtensionRegistryDialog(QDialog):
         
         # Category selection
         category_combo = QComboBox()
-        categories = self.manager.get_categories(active_only=True)
-        for category in categories:
-            category_combo.addItem(category['name'], category['category_id'])
+        _fill_combo(category_combo, self._category_choices(active_only=True))
         form_layout.addRow("Category:", category_combo)
         
         # Description
@@ -693,38 +1505,43 @@ class ExtensionRegistryDialog(QDialog):
                     treat_as_disc=treat_as_disc_check.isChecked(),
                     treat_as_auxiliary=treat_as_auxiliary_check.isChecked()
                 )
-                self.load_extensions()
+                self._refresh_extension_row(extension)
                 QMessageBox.information(self, "Success", f"Extension {extension} added successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add extension: {e}")
     
     def filter_extensions(self):
-        """Filter extensions based on search and category."""
-        search_text = self.extension_search.text().lower()
-        category_filter = self.category_filter.currentText()
-        
-        for row in range(self.extensions_table.rowCount()):
-            should_show = True
-            
-            # Check search text
-            if search_text:
-                extension = self.extensions_table.item(row, 0).text().lower()
-                description = self.extensions_table.item(row, 2).text().lower()
-                if search_text not in extension and search_text not in description:
-                    should_show = False
-            
-            # Check category filter
-            if category_filter != "All Categories":
-                category = self.extensions_table.item(row, 1).text()
-                if category != category_filter:
-                    should_show = False
-            
-            self.extensions_table.setRowHidden(row, not should_show)
+        """Filter extensions based on search text.
+        
+        Loaded rows are filtered at once; the query is rerun when rows not yet
+        loaded could match. The category filter is applied by the query only.
+        """
+        search = self.extension_search.text()
+        self.extensions_proxy.set_search_text(search)
+        if self._search_needs_query('extensions', search):
+            self.load_extensions()
+    
+    def _refresh_extension_row(self, extension: str):
+        """Re-read one extension into the table after it was added or edited."""
+        record = self.manager.get_extension(extension)
+        category_id = self.category_filter.currentData()
+        visible = record is not None and category_id in (None, record['category_id'])
+        self._refresh_model_row(self.extensions_model, extension, record, visible)
+    
+    def _refresh_mapping_row(self, platform_id: int, extension: str):
+        """Re-read one mapping into the table after it was added or deleted."""
+        mappings = self.manager.get_platform_extensions(platform_id=platform_id, extension=extension)
+        visible = self.platform_filter.currentData() in (None, platform_id)
+        self._refresh_model_row(
+            self.mappings_model, (platform_id, extension), mappings[0] if mappings else None, visible
+        )
+        if self.platform_filter.currentData() is None:
+            self._rebuild_platform_filter(
+                self.mappings_model.row_at(row) for row in range(self.mappings_model.rowCount())
+            )
     
     def add_mapping(self):
         """Add a new platform-extension mapping."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QComboBox, QCheckBox, QDialogButtonBox
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Platform Mapping")
         dialog.setModal(True)
@@ -735,20 +1552,15 @@ class ExtensionRegistryDialog(QDialog):
         
         # Platform selection
         platform_combo = QComboBox()
-        with self.manager._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT platform_id, name FROM platform ORDER BY name")
-            platforms = cursor.fetchall()
-            for platform in platforms:
-                platform_combo.addItem(platform['name'], platform['platform_id'])
+        _fill_combo(platform_combo, self._platform_choices())
         form_layout.addRow("Platform:", platform_combo)
         
         # Extension selection
         extension_combo = QComboBox()
-        extensions = self.manager.get_extensions(active_only=True)
-        for ext in extensions:
-            display_text = f"{ext['extension']} ({ext['category_name']})"
-            extension_combo.addItem(display_text, ext['extension'])
+        _fill_combo(extension_combo, (
+            (f"{ext['extension']} ({ext['category_name']})", ext['extension'])
+            for ext in self._get_active_extensions()
+        ))
         form_layout.addRow("Extension:", extension_combo)
 
         # Primary checkbox
@@ -774,14 +1586,14 @@ class ExtensionRegistryDialog(QDialog):
                     extension=extension,
                     is_primary=is_primary,
                 )
-                self.load_mappings()
+                self._refresh_mapping_row(platform_id, extension)
                 QMessageBox.information(self, "Success", "Platform mapping added successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add mapping: {e}")
     
     def on_extension_selected(self):
         """Handle extension selection in the table."""
-        current_row = self.extensions_table.currentRow()
+        current_row = self.extensions_table.currentIndex().row()
         # Enable/disable action buttons based on selection
         # Implementation can be added here if needed
     
@@ -796,7 +1608,7 @@ class ExtensionRegistryDialog(QDialog):
         if reply == QMessageBox.Yes:
             try:
                 if self.manager.delete_platform_extension(platform_id, extension):
-                    self.load_mappings()
+                    self._refresh_mapping_row(platform_id, extension)
                     QMessageBox.information(self, "Success", "Platform mapping deleted successfully.")
                 else:
                     QMessageBox.warning(self, "Warning", "Failed to delete platform mapping.")
@@ -805,50 +1617,117 @@ class ExtensionRegistryDialog(QDialog):
     
     def approve_unknown(self, unknown_id: int):
         """Approve an unknown extension."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QComboBox, QLineEdit, QDialogButtonBox
+        # The row is already loaded in the table; no need to query it again
+        row = self.unknown_model.find_row(unknown_id)
+        if row is None:
+            QMessageBox.warning(self, "Error", "Unknown extension not found.")
+            return
         
+        unknown_ext = self.unknown_model.row_at(row)
+        choice = self._prompt_approval("Approve Unknown Extension", unknown_ext['extension'])
+        if choice is None:
+            return
+        
+        try:
+            if self.manager.approve_unknown_extension(unknown_id, *choice):
+                self._update_unknown_rows([row], self._approval_changes(*choice))
+                self._invalidate_tabs(1, 2)
+                QMessageBox.information(self, "Success", "Unknown extension approved and added to registry.")
+            else:
+                QMessageBox.warning(self, "Warning", "Failed to approve unknown extension.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to approve extension: {e}")
+    
+    def approve_selected_unknown(self):
+        """Approve every selected unknown extension with one category and platform."""
+        rows = sorted(
+            self.unknown_proxy.mapToSource(index).row()
+            for index in self.unknown_table.selectionModel().selectedRows()
+        )
+        unknown_exts = [self.unknown_model.row_at(row) for row in rows]
+        
+        if not unknown_exts:
+            QMessageBox.information(self, "Approve Selected", "Select one or more unknown extensions to approve.")
+            return
+        
+        choice = self._prompt_approval(
+            "Approve Selected Extensions",
+            ", ".join(ext['extension'] for ext in unknown_exts),
+        )
+        if choice is None:
+            return
+        
+        try:
+            approved = self.manager.approve_unknown_extensions(
+                [ext['unknown_extension_id'] for ext in unknown_exts], *choice
+            )
+            if approved:
+                self._update_unknown_rows(rows, self._approval_changes(*choice))
+                self._invalidate_tabs(1, 2)
+                QMessageBox.information(self, "Success", f"Approved {approved} unknown extension(s).")
+            else:
+                QMessageBox.warning(self, "Warning", "Failed to approve the selected extensions.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to approve extensions: {e}")
+    
+    def _prompt_approval(self, title: str, extensions: str) -> Optional[Tuple[int, Optional[int], Optional[str]]]:
+        """Ask for the category, platform and notes used to approve extensions.
+        
+        Returns ``(category_id, platform_id, notes)`` or None if cancelled.
+        """
+        dialog = self._approval_dialog or self._build_approval_dialog()
+        dialog.setWindowTitle(title)
+        dialog.ext_label.setText(extensions)
+        dialog.notes_edit.clear()
+        
+        # Refill the combos only when the cached choices were refetched
+        categories = self._category_choices(active_only=True)
+        platforms = self._platform_choices()
+        if (categories, platforms) != self._approval_choices:
+            dialog.category_combo.clear()
+            _fill_combo(dialog.category_combo, categories)
+            dialog.platform_combo.clear()
+            dialog.platform_combo.addItem("No Platform", None)
+            _fill_combo(dialog.platform_combo, platforms)
+            self._approval_choices = (categories, platforms)
+        else:
+            dialog.category_combo.setCurrentIndex(0)
+            dialog.platform_combo.setCurrentIndex(0)
+        
+        if dialog.exec_() != QDialog.Accepted:
+            return None
+        
+        return (
+            dialog.category_combo.currentData(),
+            dialog.platform_combo.currentData(),
+            dialog.notes_edit.text().strip() or None,
+        )
+    
+    def _build_approval_dialog(self) -> QDialog:
+        """Create the approval prompt; its fields are filled per use."""
         dialog = QDialog(self)
-        dialog.setWindowTitle("Approve Unknown Extension")
         dialog.setModal(True)
         dialog.resize(400, 200)
         
         layout = QVBoxLayout(dialog)
         form_layout = QFormLayout()
         
-        # Get unknown extension details
-        unknown_exts = self.manager.get_unknown_extensions()
-        unknown_ext = next((ext for ext in unknown_exts if ext['unknown_extension_id'] == unknown_id), None)
-        
-        if not unknown_ext:
-            QMessageBox.warning(self, "Error", "Unknown extension not found.")
-            return
-        
-        # Show extension name
-        ext_label = QLineEdit(unknown_ext['extension'])
-        ext_label.setReadOnly(True)
-        form_layout.addRow("Extension:", ext_label)
+        # Show extension names
+        dialog.ext_label = QLineEdit()
+        dialog.ext_label.setReadOnly(True)
+        form_layout.addRow("Extension:", dialog.ext_label)
         
         # Category selection
-        category_combo = QComboBox()
-        categories = self.manager.get_categories(active_only=True)
-        for category in categories:
-            category_combo.addItem(category['name'], category['category_id'])
-        form_layout.addRow("Category:", category_combo)
+        dialog.category_combo = QComboBox()
+        form_layout.addRow("Category:", dialog.category_combo)
         
         # Platform selection (optional)
-        platform_combo = QComboBox()
-        platform_combo.addItem("No Platform", None)
-        with self.manager._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT platform_id, name FROM platform ORDER BY name")
-            platforms = cursor.fetchall()
-            for platform in platforms:
-                platform_combo.addItem(platform['name'], platform['platform_id'])
-        form_layout.addRow("Platform (optional):", platform_combo)
+        dialog.platform_combo = QComboBox()
+        form_layout.addRow("Platform (optional):", dialog.platform_combo)
         
         # Notes
-        notes_edit = QLineEdit()
-        form_layout.addRow("Notes:", notes_edit)
+        dialog.notes_edit = QLineEdit()
+        form_layout.addRow("Notes:", dialog.notes_edit)
         
         layout.addLayout(form_layout)
         
@@ -858,21 +1737,8 @@ class ExtensionRegistryDialog(QDialog):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
         
-        if dialog.exec_() == QDialog.Accepted:
-            category_id = category_combo.currentData()
-            platform_id = platform_combo.currentData()
-            notes = notes_edit.text().strip() or None
-            
-            try:
-                if self.manager.approve_unknown_extension(unknown_id, category_id, platform_id, notes):
-                    self.load_unknown_extensions()
-                    self.load_extensions()
-                    self.load_mappings()
-                    QMessageBox.information(self, "Success", "Unknown extension approved and added to registry.")
-                else:
-                    QMessageBox.warning(self, "Warning", "Failed to approve unknown extension.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to approve extension: {e}")
+        self._approval_dialog = dialog
+        return dialog
     
     def reject_unknown(self, unknown_id: int):
         """Reject an unknown extension."""
@@ -883,14 +1749,8 @@ class ExtensionRegistryDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                if self.manager.reject_unknown_extension(unknown_id, "Rejected by user"):
-                    self.load_unknown_extensions()
-                    QMessageBox.information(self, "Success", "Unknown extension rejected.")
-                else:
-                    QMessageBox.warning(self, "Warning", "Failed to reject unknown extension.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to reject extension: {e}")
+            if self._set_unknown_status(unknown_id, 'rejected', "Rejected by user"):
+                QMessageBox.information(self, "Success", "Unknown extension rejected.")
     
     def ignore_unknown(self, unknown_id: int):
         """Ignore an unknown extension."""
@@ -901,63 +1761,85 @@ class ExtensionRegistryDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                if self.manager.ignore_unknown_extension(unknown_id, "Ignored by user"):
-                    self.load_unknown_extensions()
-                    QMessageBox.information(self, "Success", "Unknown extension ignored.")
-                else:
-                    QMessageBox.warning(self, "Warning", "Failed to ignore unknown extension.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to ignore extension: {e}")
+            if self._set_unknown_status(unknown_id, 'ignored', "Ignored by user"):
+                QMessageBox.information(self, "Success", "Unknown extension ignored.")
     
-    def filter_categories(self):
-        """Filter categories based on search text."""
-        search_text = self.category_search.text().lower()
-        
-        for i in range(self.categories_list.count()):
-            item = self.categories_list.item(i)
-            item_text = item.text().lower()
-            should_show = search_text in item_text
-            item.setHidden(not should_show)
+    def _refresh_model_row(self, model: RegistryTableModel, key: Any,
+                           record: Optional[Dict[str, Any]], visible: bool = True):
+        """Insert, update or remove the row for ``key`` after a single-record write.
+        
+        ``visible`` is False when the record no longer matches the tab's query filter.
+        """
+        row = model.find_row(key)
+        if record is None or not visible:
+            if row is not None:
+                model.remove_row(row)
+        elif row is None:
+            model.insert_row(record)
+        else:
+            model.update_row(row, record)
+    
+    def _approval_changes(self, category_id: int, platform_id: Optional[int],
+                          notes: Optional[str]) -> Dict[str, Any]:
+        """Return the unknown extension fields written by an approval."""
+        category = self._categories_by_id.get(category_id)
+        platform = next(
+            (platform for platform in self._get_platforms() if platform['platform_id'] == platform_id),
+            None,
+        )
+        return {
+            'status': 'approved',
+            'notes': notes,
+            'suggested_category_id': category_id,
+            'suggested_category': category['name'] if category else None,
+            'suggested_platform_id': platform_id,
+            'suggested_platform': platform['name'] if platform else None,
+        }
     
-    def filter_mappings(self):
-        """Filter platform mappings based on platform selection."""
-        platform_filter = self.platform_filter.currentText()
+    def _set_unknown_status(self, unknown_id: int, status: str, notes: str) -> bool:
+        """Store a new status and update the affected table row in place."""
+        try:
+            if not self.manager.update_unknown_extension(unknown_id, status=status, notes=notes):
+                QMessageBox.warning(self, "Warning", f"Failed to mark unknown extension as {status}.")
+                return False
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to update extension: {e}")
+            return False
         
-        for row in range(self.mappings_table.rowCount()):
-            if platform_filter == "All Platforms":
-                self.mappings_table.setRowHidden(row, False)
-            else:
-                platform = self.mappings_table.item(row, 0).text()
-                should_show = platform == platform_filter
-                self.mappings_table.setRowHidden(row, not should_show)
+        row = self.unknown_model.find_row(unknown_id)
+        if row is None:
+            self.load_unknown_extensions()
+            return True
+        
+        self._update_unknown_rows([row], {'status': status, 'notes': notes})
+        return True
+    
+    def _update_unknown_rows(self, rows: List[int], changes: Dict[str, Any]):
+        """Apply a status change in place; rows leaving the status filter are removed."""
+        if self.status_filter.currentData() in (None, changes['status']):
+            for row in rows:
+                self.unknown_model.update_row(row, dict(changes))
+        else:
+            for row in sorted(rows, reverse=True):
+                self.unknown_model.remove_row(row)
+    
+    def filter_categories(self):
+        """Filter categories based on search text."""
+        self.categories_proxy.setFilterFixedString(self.category_search.text())
     
     def filter_unknown(self):
-        """Filter unknown extensions based on search and status."""
-        search_text = self.unknown_search.text().lower()
-        status_filter = self.status_filter.currentText()
-        
-        for row in range(self.unknown_table.rowCount()):
-            should_show = True
-            
-            # Check search text
-            if search_text:
-                extension = self.unknown_table.item(row, 0).text().lower()
-                if search_text not in extension:
-                    should_show = False
-            
-            # Check status filter
-            if status_filter != "All Status":
-                status = self.unknown_table.item(row, 2).text()
-                if status_filter.lower() not in status.lower():
-                    should_show = False
-            
-            self.unknown_table.setRowHidden(row, not should_show)
+        """Filter unknown extensions based on search text.
+        
+        Loaded rows are filtered at once; the query is rerun when rows not yet
+        loaded could match. The status filter is applied by the query only.
+        """
+        search = self.unknown_search.text()
+        self.unknown_proxy.set_search_text(search)
+        if self._search_needs_query('unknown', search):
+            self.load_unknown_extensions()
     
     def add_category(self):
         """Add a new file type category."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QTextEdit, QSpinBox, QCheckBox, QDialogButtonBox
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Category")
         dialog.setModal(True)
@@ -1011,15 +1893,16 @@ class ExtensionRegistryDialog(QDialog):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add category: {e}")
     
-    def on_category_selected(self, item):
+    def on_category_selected(self, index: QModelIndex):
         """Handle category selection."""
-        if not item:
+        if not index.isValid():
             return
             
-        if not (category_id := item.data(Qt.UserRole)):
+        if not (category_id := index.data(Qt.UserRole)):
             return
             
-        if not (category := self.manager.get_category(category_id)):
+        category = self._categories_by_id.get(category_id) or self.manager.get_category(category_id)
+        if not category:
             return
             
         self._populate_category_form(category_id, category)
@@ -1029,7 +1912,7 @@ class ExtensionRegistryDialog(QDialog):
         self.current_category_id = category_id
         self.category_name_edit.setText(category['name'])
         self.category_description_edit.setPlainText(category['description'] or "")
-        self.category_sort_order_edit.setText(str(category['sort_order']))
+        self.category_sort_order_edit.setValue(int(category['sort_order'] or 0))
         self.category_active_check.setChecked(bool(category['is_active']))
 
         # Enable update/delete buttons
@@ -1044,7 +1927,7 @@ class ExtensionRegistryDialog(QDialog):
         
         name = self.category_name_edit.text().strip()
         description = self.category_description_edit.toPlainText().strip() or None
-        sort_order = int(self.category_sort_order_edit.text() or 0)
+        sort_order = self.category_sort_order_edit.value()
         is_active = self.category_active_check.isChecked()
         
         if not name:
@@ -1093,7 +1976,7 @@ class ExtensionRegistryDialog(QDialog):
         """Clear the category form."""
         self.category_name_edit.clear()
         self.category_description_edit.clear()
-        self.category_sort_order_edit.setText("0")
+        self.category_sort_order_edit.setValue(0)
         self.category_active_check.setChecked(True)
         self.update_category_btn.setEnabled(False)
         self.delete_category_btn.setEnabled(False)
@@ -1106,8 +1989,6 @@ class ExtensionRegistryDialog(QDialog):
             QMessageBox.warning(self, "Warning", "Extension not found.")
             return
 
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QComboBox, QCheckBox, QDialogButtonBox
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Edit Extension")
         dialog.setModal(True)
@@ -1123,11 +2004,7 @@ class ExtensionRegistryDialog(QDialog):
 
         # Category selection
         category_combo = QComboBox()
-        categories = self.manager.get_categories(active_only=False)
-        for category in categories:
-            category_combo.addItem(category['name'], category['category_id'])
-            if category['category_id'] == extension['category_id']:
-                category_combo.setCurrentIndex(category_combo.count() - 1)
+        _fill_combo(category_combo, self._category_choices(), extension['category_id'])
         form_layout.addRow("Category:", category_combo)
         
         # Description
@@ -1177,7 +2054,9 @@ class ExtensionRegistryDialog(QDialog):
                     treat_as_auxiliary=auxiliary_check.isChecked(),
                     is_active=active_check.isChecked()
                 ):
-                    self.load_extensions()
+                    self._refresh_extension_row(extension_name)
+                    # Mappings show the extension's category and description
+                    self._invalidate_tabs(2)
                     QMessageBox.information(self, "Success", "Extension updated successfully.")
                 else:
                     QMessageBox.warning(self, "Warning", "Failed to update extension.")
@@ -1186,8 +2065,6 @@ class ExtensionRegistryDialog(QDialog):
     
     def export_data(self, format: str):
         """Export extension registry data."""
-        from PyQt5.QtWidgets import QFileDialog
-        
         # Get save file path
         file_filter = "JSON files (*.json)" if format == 'json' else "CSV files (*.csv)"
         file_path, _ = QFileDialog.getSaveFileName(
@@ -1198,21 +2075,10 @@ class ExtensionRegistryDialog(QDialog):
         if not file_path:
             return
         
-        try:
-            if success := self.manager.export_extensions(file_path, format):
-                self.status_text.append(f"✅ Export successful: {file_path}")
-                QMessageBox.information(self, "Export Successful", f"Extension registry exported to:\n{file_path}")
-            else:
-                self.status_text.append(f"❌ Export failed: {file_path}")
-                QMessageBox.critical(self, "Export Failed", "Failed to export extension registry.")
-        except Exception as e:
-            self.status_text.append(f"❌ Export error: {e}")
-            QMessageBox.critical(self, "Export Error", f"Export failed: {e}")
+        self._start_transfer('export', file_path, format)
     
     def import_data(self, format: str):
         """Import extension registry data."""
-        from PyQt5.QtWidgets import QFileDialog
-        
         if format != 'json':
             self.status_text.append("⚠️ Import cancelled: Only JSON imports are supported.")
             QMessageBox.warning(
@@ -1231,28 +2097,71 @@ class ExtensionRegistryDialog(QDialog):
         if not file_path:
             return
         
-        try:
-            overwrite = self.overwrite_check.isChecked()
-            results = self.manager.import_extensions(file_path, format, overwrite)
-            
-            if results['success']:
-                self._handle_import_success(file_path, results)
+        self._start_transfer('import', file_path, format, self.overwrite_check.isChecked())
+    
+    def _start_transfer(self, operation: str, file_path: str, format: str, overwrite: bool = False):
+        """Run an import or export on a worker thread; one runs at a time."""
+        worker = RegistryTransferWorker(
+            self.db_path, operation, file_path, format, overwrite, self.manager.use_wal, self
+        )
+        worker.completed.connect(lambda _, result: self._on_transfer_completed(worker, result))
+        worker.error.connect(lambda _, error: self._on_transfer_error(worker, error))
+        worker.finished.connect(lambda: self._on_transfer_finished(worker))
+        self._running_workers.append(worker)
+        
+        self.export_group.setEnabled(False)
+        self.import_group.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.status_bar.showMessage(f"{operation.title()}ing {file_path}...")
+        worker.start()
+    
+    def _on_transfer_completed(self, worker: RegistryTransferWorker, result: Any):
+        """Report the outcome of an import or export."""
+        file_path = worker.file_path
+        if worker.operation == 'export':
+            if result:
+                self.status_text.append(f"✅ Export successful: {file_path}")
+                QMessageBox.information(self, "Export Successful", f"Extension registry exported to:\n{file_path}")
             else:
-                self._handle_import_failure(file_path, results)
-                
-        except Exception as e:
-            self.status_text.append(f"❌ Import error: {e}")
-            QMessageBox.critical(self, "Import Error", f"Import failed: {e}")
+                self.status_text.append(f"❌ Export failed: {file_path}")
+                QMessageBox.critical(self, "Export Failed", "Failed to export extension registry.")
+            return
+        
+        # The import wrote through the worker's connection, so drop our cached reads
+        self.manager.invalidate_caches()
+        if result['success']:
+            self._handle_import_success(file_path, result)
+        else:
+            self._handle_import_failure(file_path, result)
+    
+    def _on_transfer_error(self, worker: RegistryTransferWorker, error: str):
+        """Report an import or export that raised."""
+        title = worker.operation.title()
+        self.status_text.append(f"❌ {title} error: {error}")
+        QMessageBox.critical(self, f"{title} Error", f"{title} failed: {error}")
+    
+    def _on_transfer_finished(self, worker: RegistryTransferWorker):
+        """Re-enable the import/export controls once the worker is done."""
+        self.export_group.setEnabled(True)
+        self.import_group.setEnabled(True)
+        self._release_worker(worker)
     
     def _handle_import_success(self, file_path: str, results: Dict[str, Any]):
         """Handle successful import."""
-        self.status_text.append(f"✅ Import successful: {file_path}")
-        self.status_text.append(f"   Categories: {results['categories_imported']}")
-        self.status_text.append(f"   Extensions: {results['extensions_imported']}")
-        self.status_text.append(f"   Mappings: {results['mappings_imported']}")
-        self.status_text.append(f"   Unknown: {results['unknown_imported']}")
+        # One append lays the status log out once instead of once per line
+        lines = [
+            f"✅ Import successful: {file_path}",
+            f"   Categories: {results['categories_imported']}",
+            f"   Extensions: {results['extensions_imported']}",
+            f"   Mappings: {results['mappings_imported']}",
+            f"   Unknown: {results['unknown_imported']}",
+        ]
+        if results.get('duplicates_skipped'):
+            lines.append(f"   Duplicate rows skipped: {results['duplicates_skipped']}")
+        self.status_text.append("\n".join(lines))
 
-        # Refresh all data
+        # The import bumped the manager's data version, so every cache refetches;
+        # only the visible tab reloads now, the rest when shown
         self.load_data()
 
         success_message = (
@@ -1272,10 +2181,6 @@ class ExtensionRegistryDialog(QDialog):
             error_msg += f"\n... and {len(results['errors']) - 5} more errors"
         QMessageBox.critical(self, "Import Failed", f"Import failed:\n{error_msg}")
 
-    def closeEvent(self, event):
-        """Handle dialog close event."""
-        event.accept()
-
 
 if __name__ == '__main__':
     from PyQt5.QtWidgets import QApplication
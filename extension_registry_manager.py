@@ -6,28 +6,534 @@ This module provides comprehensive CRUD operations for the extension registry sy
 including file type categories, file extensions, platform mappings, and unknown extension handling.
 """
 
+import re
 import sqlite3
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+import threading
+import os
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple, Any, Callable, FrozenSet, Set
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # Optional: imports fall back to json.load
+    ijson = None
+
+
+# Database files whose statistics were already refreshed on open in this process
+_optimized_paths = set()
+_optimized_paths_lock = threading.Lock()
+
+
+# Columns each update_* method may set, in the order they appear in the SQL
+_CATEGORY_UPDATE_COLUMNS = ('name', 'description', 'sort_order', 'is_active')
+_EXTENSION_UPDATE_COLUMNS = (
+    'extension', 'category_id', 'description',
+    'is_active', 'treat_as_archive', 'treat_as_disc', 'treat_as_auxiliary',
+)
+_MAPPING_UPDATE_COLUMNS = ('is_primary',)
+_UNKNOWN_UPDATE_COLUMNS = ('suggested_category_id', 'suggested_platform_id', 'status', 'notes')
+
+# Defaults and parameter getters for import rows that are copied as they are
+_CATEGORY_IMPORT_DEFAULTS = {'description': None, 'sort_order': 0, 'is_active': True}
+_CATEGORY_IMPORT_ROW = itemgetter('name', 'description', 'sort_order', 'is_active')
+_UNKNOWN_IMPORT_DEFAULTS = {'file_count': 1, 'status': 'pending', 'notes': None}
+_UNKNOWN_IMPORT_ROW = itemgetter(
+    'extension', 'file_count', 'status', 'suggested_category_id', 'suggested_platform_id', 'notes',
+)
+
+
+@lru_cache(maxsize=64)
+def _update_sql(table: str, columns: Tuple[str, ...], where: str, touch: bool = False) -> str:
+    """Build an UPDATE statement for ``columns``; ``touch`` also sets ``updated_at``.
+    
+    Columns arrive in their whitelist order, so each column set maps to one
+    SQL string and one cached prepared statement.
+    """
+    assignments = [f"{column} = ?" for column in columns]
+    if touch:
+        assignments.append("updated_at = ?")
+    return f"UPDATE {table} SET {', '.join(assignments)} WHERE {where}"
+
+
+class _RegistryConnection(sqlite3.Connection):
+    """Connection whose ``with`` blocks are serialised across threads.
+    
+    Each manager method runs inside ``with conn:``, so holding a re-entrant lock
+    for the block keeps one thread's statements and commit from interleaving
+    with another's on the shared connection.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+    
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            return super().__enter__()
+        except BaseException:
+            self._lock.release()
+            raise
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._lock.release()
+
+
+class _ImportBatch:
+    """Queue rows for one import upsert and write them as multi-row inserts.
+    
+    Each flush sends the queued rows as ``INSERT ... VALUES (...), (...)``
+    statements of up to ``MAX_VARIABLES`` parameters, so SQLite steps one
+    statement per chunk instead of one per row.
+    
+    Rows are keyed by their first ``key_size`` parameters, the conflict
+    target. A repeated key replaces the queued row when ``keep_last`` is set
+    and is dropped otherwise, matching what the upsert would leave behind.
+    ``changes`` totals the rows the statement inserted or updated, so upserts
+    that did nothing on a conflict are not counted.
+    """
+    
+    # SQLite's historical default limit on bound parameters per statement
+    MAX_VARIABLES = 999
+    
+    def __init__(self, cursor: sqlite3.Cursor, insert: str, conflict: str, batch_size: int,
+                 key_size: int = 1, keep_last: bool = False):
+        self.cursor = cursor
+        self.insert = insert
+        self.conflict = conflict
+        self.batch_size = batch_size
+        self.key_size = key_size
+        self.keep_last = keep_last
+        self.rows: Dict[tuple, tuple] = {}
+        self.seen: Set[tuple] = set()
+        self.changes = 0
+        self.duplicates = 0
+        self.errors: List[sqlite3.Error] = []
+        self._statements: Dict[int, str] = {}
+    
+    def add(self, params: tuple):
+        """Queue one row, flushing once ``batch_size`` are pending."""
+        key = params[:self.key_size]
+        if key in self.seen:
+            self.duplicates += 1
+            if not self.keep_last:
+                return
+        self.seen.add(key)
+        self.rows[key] = params
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+    
+    def _statement(self, row_count: int, width: int) -> str:
+        """Build, once per row count, the upsert for ``row_count`` rows."""
+        if row_count not in self._statements:
+            values = ", ".join([f"({', '.join('?' * width)})"] * row_count)
+            self._statements[row_count] = f"{self.insert} VALUES {values} {self.conflict}"
+        return self._statements[row_count]
+    
+    def flush(self):
+        """Write every queued row.
+        
+        The queue is emptied even when a write fails, so failed rows are
+        reported once rather than sent again with the next batch. Failures
+        are kept in ``errors`` for the section to report, rather than raised
+        into the handler of whichever row filled the batch.
+        """
+        if not self.rows:
+            return
+        rows = list(self.rows.values())
+        self.rows.clear()
+        width = len(rows[0])
+        chunk_size = max(1, self.MAX_VARIABLES // width)
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                self.cursor.execute(self._statement(len(chunk), width), list(chain.from_iterable(chunk)))
+                self.changes += self.cursor.rowcount
+        except sqlite3.Error as e:
+            self.errors.append(e)
+
+
+class _ImportLookups:
+    """Resolve import references against keys loaded once per table.
+    
+    Each table is read in full the first time it is consulted, which is
+    after the import has written it, so rows from earlier sections resolve.
+    """
+    
+    def __init__(self, cursor: sqlite3.Cursor):
+        self.cursor = cursor
+        self._categories: Optional[Dict[str, int]] = None
+        self._category_ids: Set[int] = set()
+        self._extensions: Optional[Set[str]] = None
+        self._platforms: Optional[Dict[str, int]] = None
+        self._platform_ids: Set[int] = set()
+    
+    def _load_categories(self) -> Dict[str, int]:
+        if self._categories is None:
+            self._categories = dict(self.cursor.execute(
+                "SELECT name, category_id FROM file_type_category"
+            ).fetchall())
+            self._category_ids = set(self._categories.values())
+        return self._categories
+    
+    def _load_platforms(self) -> Dict[str, int]:
+        if self._platforms is None:
+            self._platforms = dict(self.cursor.execute(
+                "SELECT name, platform_id FROM platform"
+            ).fetchall())
+            self._platform_ids = set(self._platforms.values())
+        return self._platforms
+    
+    def category_id(self, name: Optional[str]) -> Optional[int]:
+        """Resolve a category ID from its name."""
+        return self._load_categories().get(name) if name else None
+    
+    def has_category(self, category_id: Optional[int]) -> bool:
+        """Check if a category with the given ID exists."""
+        if not category_id:
+            return False
+        self._load_categories()
+        return category_id in self._category_ids
+    
+    def has_extension(self, extension: Optional[str]) -> bool:
+        """Check if an extension with the given name exists."""
+        if not extension:
+            return False
+        if self._extensions is None:
+            self._extensions = {
+                row[0] for row in self.cursor.execute("SELECT extension FROM file_extension")
+            }
+        return extension in self._extensions
+    
+    def platform_id(self, name: Optional[str], create_if_missing: bool = False) -> Optional[int]:
+        """Resolve a platform ID from its name, optionally creating it."""
+        if not name:
+            return None
+        platforms = self._load_platforms()
+        if (platform_id := platforms.get(name)) is None and create_if_missing:
+            self.cursor.execute("INSERT INTO platform (name) VALUES (?)", (name,))
+            platform_id = platforms[name] = self.cursor.lastrowid
+            self._platform_ids.add(platform_id)
+        return platform_id
+    
+    def has_platform(self, platform_id: Optional[int]) -> bool:
+        """Check if a platform with the given ID exists."""
+        if not platform_id:
+            return False
+        self._load_platforms()
+        return platform_id in self._platform_ids
+
 
 class ExtensionRegistryManager:
     """Manages file extensions, categories, and platform mappings."""
     
-    def __init__(self, db_path: str):
-        """Initialize the extension registry manager."""
+    # Prepared statements kept per connection; the registry issues well under this many distinct queries
+    CACHED_STATEMENTS = 256
+    
+    # PRAGMA synchronous for each durability setting
+    SYNCHRONOUS_MODES = {'normal': 'NORMAL', 'full': 'FULL'}
+    
+    # Tables analysed when the database has no planner statistics yet
+    _REGISTRY_TABLES = ('file_type_category', 'file_extension', 'platform_extension', 'unknown_extension')
+    
+    # Indexes for the registry's filter queries, as (name, table and columns)
+    _REGISTRY_INDEXES = (
+        ('idx_file_extension_category_active', 'file_extension(category_id, is_active)'),
+        ('idx_unknown_extension_status_seen', 'unknown_extension(status, first_seen)'),
+    )
+    
+    # Rows fetched per batch while streaming an export
+    EXPORT_BATCH_SIZE = 1000
+    
+    # JSON export sections as (key, query); each query matches its unfiltered get_* method
+    _JSON_EXPORT_SECTIONS = (
+        ('categories', """
+            SELECT * FROM file_type_category
+            ORDER BY sort_order, name
+        """),
+        ('extensions', """
+            SELECT fe.*, ftc.name as category_name, ftc.description as category_description
+            FROM file_extension fe
+            JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+            ORDER BY ftc.sort_order, ftc.name, fe.extension
+        """),
+        ('mappings', """
+            SELECT pe.*, p.name as platform_name, fe.extension, fe.description as extension_description,
+                   ftc.name as category_name
+            FROM platform_extension pe
+            JOIN platform p ON pe.platform_id = p.platform_id
+            JOIN file_extension fe ON pe.extension = fe.extension
+            JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+            ORDER BY p.name, pe.is_primary DESC, fe.extension
+        """),
+        ('unknown_extensions', """
+            SELECT ue.*, ftc.name as suggested_category, p.name as suggested_platform
+            FROM unknown_extension ue
+            LEFT JOIN file_type_category ftc ON ue.suggested_category_id = ftc.category_id
+            LEFT JOIN platform p ON ue.suggested_platform_id = p.platform_id
+            ORDER BY ue.file_count DESC, ue.first_seen DESC, ue.unknown_extension_id
+        """),
+    )
+    
+    # CSV export sections as (title, header, query); queries match the get_* orderings
+    _CSV_EXPORT_SECTIONS = (
+        (
+            'CATEGORIES',
+            ['category_id', 'name', 'description', 'sort_order', 'is_active'],
+            """
+                SELECT category_id, name, COALESCE(description, ''), sort_order, is_active
+                FROM file_type_category
+                ORDER BY sort_order, name
+            """,
+        ),
+        (
+            'EXTENSIONS',
+            ['extension', 'category_id', 'description', 'is_active',
+             'treat_as_archive', 'treat_as_disc', 'treat_as_auxiliary'],
+            """
+                SELECT fe.extension, fe.category_id, COALESCE(fe.description, ''), fe.is_active,
+                       fe.treat_as_archive, fe.treat_as_disc, fe.treat_as_auxiliary
+                FROM file_extension fe
+                JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+                ORDER BY ftc.sort_order, ftc.name, fe.extension
+            """,
+        ),
+        (
+            'PLATFORM MAPPINGS',
+            ['platform_id', 'platform_name', 'extension', 'is_primary'],
+            """
+                SELECT pe.platform_id, p.name, fe.extension, pe.is_primary
+                FROM platform_extension pe
+                JOIN platform p ON pe.platform_id = p.platform_id
+                JOIN file_extension fe ON pe.extension = fe.extension
+                JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+                ORDER BY p.name, pe.is_primary DESC, fe.extension
+            """,
+        ),
+        (
+            'UNKNOWN EXTENSIONS',
+            ['unknown_extension_id', 'extension', 'file_count', 'status',
+             'suggested_category_id', 'suggested_platform_id', 'notes',
+             'first_seen', 'last_seen'],
+            """
+                SELECT unknown_extension_id, extension, file_count, status,
+                       COALESCE(suggested_category_id, ''), COALESCE(suggested_platform_id, ''),
+                       COALESCE(notes, ''), COALESCE(first_seen, ''), COALESCE(last_seen, '')
+                FROM unknown_extension
+                ORDER BY file_count DESC, first_seen DESC, unknown_extension_id
+            """,
+        ),
+    )
+    
+    # Rows queued per executemany flush during imports
+    IMPORT_BATCH_SIZE = 1000
+    
+    # Import files from this size on are streamed section by section when ijson is available
+    STREAM_IMPORT_MIN_BYTES = 8 * 1024 * 1024
+    
+    # Import upserts per section as (INSERT INTO clause, conflict target,
+    # columns copied on overwrite, whether overwrites also set updated_at)
+    _IMPORT_STATEMENTS = {
+        'categories': (
+            "INSERT INTO file_type_category (name, description, sort_order, is_active)",
+            'name',
+            ('description', 'sort_order', 'is_active'),
+            False,
+        ),
+        'extensions': (
+            """
+                INSERT INTO file_extension
+                (extension, category_id, description, is_active,
+                 treat_as_archive, treat_as_disc, treat_as_auxiliary)
+            """,
+            'extension',
+            (
+                'category_id', 'description', 'is_active',
+                'treat_as_archive', 'treat_as_disc', 'treat_as_auxiliary',
+            ),
+            True,
+        ),
+        'mappings': (
+            "INSERT INTO platform_extension (platform_id, extension, is_primary)",
+            'platform_id, extension',
+            ('is_primary',),
+            False,
+        ),
+        'unknown_extensions': (
+            """
+                INSERT INTO unknown_extension
+                (extension, file_count, status, suggested_category_id, suggested_platform_id, notes)
+            """,
+            'extension',
+            ('file_count', 'status', 'suggested_category_id', 'suggested_platform_id', 'notes'),
+            False,
+        ),
+    }
+    
+    # Column names of the summary query, grouped by summary section
+    _SUMMARY_SECTIONS = {
+        'categories': ('total_categories', 'active_categories'),
+        'extensions': (
+            'total_extensions', 'active_extensions', 'archive_extensions',
+            'disc_extensions', 'auxiliary_extensions', 'rom_extensions',
+        ),
+        'mappings': ('total_mappings', 'primary_mappings', 'platforms_with_mappings'),
+        'unknown': (
+            'total_unknown', 'pending_unknown', 'approved_unknown',
+            'rejected_unknown', 'ignored_unknown',
+        ),
+    }
+    
+    def __init__(self, db_path: str, use_wal: bool = True, durability: str = 'normal'):
+        """Initialize the extension registry manager.
+        
+        Set ``use_wal=False`` for databases on network filesystems, where WAL's
+        shared-memory index and memory-mapped I/O are not reliable.
+        
+        ``durability='normal'`` lets WAL commits skip the fsync per transaction
+        (a power loss may drop the last commits but never corrupts the file);
+        ``durability='full'`` syncs every commit.
+        """
+        if durability not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported durability {durability!r}; expected 'normal' or 'full'")
         self.db_path = db_path
+        self.use_wal = use_wal
+        self.durability = durability
         self.logger = logging.getLogger(__name__)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connect_lock = threading.Lock()
+        self._data_version = 0
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Bumped only when categories, extensions or mappings change
+        self._registry_version = 0
+        # Single-record lookups by (kind, key), valid for _record_cache_version
+        self._record_cache: Dict[Tuple[str, Any], Optional[Dict]] = {}
+        self._record_cache_version = 0
+        # Every extension record by name, valid for _extension_records_version
+        self._extension_records: Dict[str, Dict] = {}
+        self._extension_records_version: Optional[int] = None
+        # PRAGMA data_version last seen, to notice commits from other connections
+        self._external_data_version: Optional[int] = None
         
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(self.db_path)
+        """Get the shared database connection, opening it on first use.
+        
+        The connection may be used from any thread; ``with`` blocks on it are
+        serialised by :class:`_RegistryConnection`.
+        """
+        with self._connect_lock:
+            if self._connection is None:
+                self._connection = self._open_connection()
+        return self._connection
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the connection and apply the registry's pragmas and indexes."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            factory=_RegistryConnection,
+            cached_statements=self.CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+        if self.use_wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA mmap_size = 268435456")
+        if self.use_wal or self.durability == 'full':
+            # Rollback-journal mode keeps SQLite's default FULL unless asked otherwise
+            conn.execute(f"PRAGMA synchronous = {self.SYNCHRONOUS_MODES[self.durability]}")
+        self._prepare_database(conn)
         return conn
     
+    def _prepare_database(self, conn: sqlite3.Connection):
+        """Make sure the registry indexes and planner statistics exist.
+        
+        Both checks only read ``sqlite_master`` unless something is missing,
+        so they run on every open and cover a file recreated at the same path.
+        """
+        self._ensure_indexes(conn)
+        self._ensure_statistics(conn)
+    
+    def _ensure_indexes(self, conn: sqlite3.Connection):
+        """Create indexes for the registry's filter queries on older databases."""
+        try:
+            existing = {
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            missing = [(name, target) for name, target in self._REGISTRY_INDEXES if name not in existing]
+            if not missing:
+                return
+            for name, target in missing:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            # Read-only databases or ones without the registry tables
+            conn.rollback()
+            self.logger.debug(f"Skipped extension registry indexes: {e}")
+    
+    def _ensure_statistics(self, conn: sqlite3.Connection):
+        """Give the query planner statistics for the registry tables.
+        
+        Tables are analysed whenever the database has no statistics yet.
+        Existing statistics are refreshed with ``PRAGMA optimize`` on the
+        first open of each file per process; load and transfer workers open
+        a manager each, so later opens skip it and ``close`` refreshes them.
+        """
+        in_memory = self.db_path == ':memory:' or 'mode=memory' in self.db_path
+        path = os.path.abspath(self.db_path)
+        with _optimized_paths_lock:
+            try:
+                has_stats = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+                ).fetchone()
+                if not has_stats:
+                    for table in self._REGISTRY_TABLES:
+                        conn.execute(f"ANALYZE {table}")
+                elif in_memory or path not in _optimized_paths:
+                    conn.execute("PRAGMA optimize")
+                else:
+                    return
+                conn.commit()
+                if not in_memory:
+                    _optimized_paths.add(path)
+            except sqlite3.OperationalError as e:
+                conn.rollback()
+                self.logger.debug(f"Skipped extension registry statistics: {e}")
+    
+    def close(self):
+        """Close the shared database connection, letting SQLite refresh stale statistics first.
+        
+        Waits for any thread inside a ``with`` block on the connection. The
+        connection lock is taken before ``_connect_lock``, the same order as
+        methods that reach ``_get_connection`` from inside such a block.
+        """
+        conn = self._connection
+        if conn is None:
+            return
+        with conn._lock, self._connect_lock:
+            if self._connection is not conn:
+                return  # Closed by another thread meanwhile
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                self.logger.debug(f"Skipped PRAGMA optimize on close: {e}")
+            conn.close()
+            self._connection = None
+            # Commits made while closed would go unnoticed, so start over
+            self._external_data_version = None
+            self.invalidate_caches()
+    
     # =============================================================================
     # FILE TYPE CATEGORY OPERATIONS
     # =============================================================================
@@ -42,6 +548,7 @@ class ExtensionRegistryManager:
             """, (name, description, sort_order, is_active))
             category_id = cursor.lastrowid
             conn.commit()
+            self.invalidate_caches()
             
             self.logger.info(f"Created file type category: {name} (ID: {category_id})")
             return category_id
@@ -59,10 +566,14 @@ class ExtensionRegistryManager:
             query += " ORDER BY sort_order, name"
             
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return self._fetch_dicts(cursor)
     
     def get_category(self, category_id: int) -> Optional[Dict]:
         """Get a specific file type category."""
+        return self._cached_record(('category', category_id), lambda: self._fetch_category(category_id))
+    
+    def _fetch_category(self, category_id: int) -> Optional[Dict]:
+        """Query a file type category by ID."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM file_type_category WHERE category_id = ?", (category_id,))
@@ -71,29 +582,17 @@ class ExtensionRegistryManager:
     
     def update_category(self, category_id: int, **kwargs) -> bool:
         """Update a file type category."""
-        if not kwargs:
+        columns = tuple(column for column in _CATEGORY_UPDATE_COLUMNS if column in kwargs)
+        if not columns:
             return False
-            
+        params = [kwargs[column] for column in columns]
+        params.append(category_id)
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Build dynamic update query
-            set_clauses = []
-            params = []
-            
-            for key, value in kwargs.items():
-                if key in ['name', 'description', 'sort_order', 'is_active']:
-                    set_clauses.append(f"{key} = ?")
-                    params.append(value)
-            
-            if not set_clauses:
-                return False
-            
-            params.append(category_id)
-            query = f"UPDATE file_type_category SET {', '.join(set_clauses)} WHERE category_id = ?"
-            
-            cursor.execute(query, params)
+            cursor.execute(_update_sql('file_type_category', columns, 'category_id = ?'), params)
             conn.commit()
+            self.invalidate_caches()
             
             self.logger.info(f"Updated file type category ID {category_id}")
             return cursor.rowcount > 0
@@ -153,13 +652,19 @@ class ExtensionRegistryManager:
                 ),
             )
             conn.commit()
+            self.invalidate_caches()
 
             self.logger.info(f"Created file extension: {extension}")
             return extension
     
     def get_extensions(self, category_id: int = None, active_only: bool = True,
-                      extension_type: str = None) -> List[Dict]:
-        """Get file extensions with optional filtering."""
+                      extension_type: str = None, search: str = None,
+                      limit: int = None, offset: int = 0) -> List[Dict]:
+        """Get file extensions with optional filtering.
+        
+        ``search`` matches a case-insensitive substring of the extension or its
+        description; ``limit``/``offset`` page through the ordered result.
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
@@ -177,7 +682,7 @@ class ExtensionRegistryManager:
             if category_id:
                 query += " AND fe.category_id = ?"
                 params.append(category_id)
-            
+        
             if extension_type:
                 if extension_type == 'archive':
                     query += " AND fe.treat_as_archive = 1"
@@ -186,10 +691,19 @@ class ExtensionRegistryManager:
                 elif extension_type == 'auxiliary':
                     query += " AND fe.treat_as_auxiliary = 1"
             
+            if search:
+                pattern = "%" + re.sub(r"([\\%_])", r"\\\1", search) + "%"
+                query += " AND (fe.extension LIKE ? ESCAPE '\\' OR fe.description LIKE ? ESCAPE '\\')"
+                params.extend([pattern, pattern])
+            
             query += " ORDER BY ftc.sort_order, ftc.name, fe.extension"
             
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
+            
             cursor.execute(query, params)
-            return [self._format_extension_record(row) for row in cursor.fetchall()]
+            return [self._format_extension_record(row) for row in self._fetch_dicts(cursor)]
     
     def get_extension(self, extension: str) -> Optional[Dict]:
         """Get a specific file extension."""
@@ -206,21 +720,51 @@ class ExtensionRegistryManager:
     
     def get_extension_by_name(self, extension: str) -> Optional[Dict]:
         """Get a file extension by its name (e.g., '.rom')."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT fe.*, ftc.name as category_name, ftc.description as category_description
-                FROM file_extension fe
-                JOIN file_type_category ftc ON fe.category_id = ftc.category_id
-                WHERE fe.extension = ?
-            """, (extension,))
-            row = cursor.fetchone()
-            return self._format_extension_record(row) if row else None
+        record = self._get_extension_records().get(extension)
+        return dict(record) if record is not None else None
+    
+    def _get_extension_records(self) -> Dict[str, Dict]:
+        """Return every extension record keyed by name, held in memory.
+        
+        The registry is small, so it is mirrored with one query and reloaded
+        only after categories, extensions or mappings change. Recording
+        unknown extensions during a scan leaves the mirror in place.
+        """
+        self._sync_data_version()
+        if self._extension_records_version != self._registry_version:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT fe.*, ftc.name as category_name, ftc.description as category_description
+                    FROM file_extension fe
+                    JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+                """)
+                self._extension_records = {
+                    record['extension']: self._format_extension_record(record)
+                    for record in self._fetch_dicts(cursor)
+                }
+            self._extension_records_version = self._registry_version
+        return self._extension_records
 
     @staticmethod
-    def _format_extension_record(row: sqlite3.Row) -> Dict[str, Any]:
-        """Format extension rows with derived fields for compatibility."""
-        data = dict(row)
+    def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """Fetch the remaining rows of an executed query as dicts.
+        
+        Rows are read as plain tuples and zipped with the column names once,
+        which is cheaper than building ``sqlite3.Row`` objects and converting them.
+        """
+        columns = [column[0] for column in cursor.description]
+        cursor.row_factory = None
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def _format_extension_record(row: Any) -> Dict[str, Any]:
+        """Format extension rows with derived fields for compatibility.
+        
+        Accepts a ``sqlite3.Row`` or a dict from :meth:`_fetch_dicts`; dicts are
+        completed in place rather than copied.
+        """
+        data = row if type(row) is dict else dict(row)
         data.setdefault('treat_as_archive', 0)
         data.setdefault('treat_as_disc', 0)
         data.setdefault('treat_as_auxiliary', 0)
@@ -235,34 +779,18 @@ class ExtensionRegistryManager:
     
     def update_extension(self, extension: str, **kwargs) -> bool:
         """Update a file extension."""
-        if not kwargs:
+        columns = tuple(column for column in _EXTENSION_UPDATE_COLUMNS if column in kwargs)
+        if not columns:
             return False
-            
+        params = [kwargs[column] for column in columns]
+        params.append(datetime.now().isoformat())
+        params.append(extension)
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Build dynamic update query
-            set_clauses = []
-            params = []
-            
-            for key, value in kwargs.items():
-                if key in ['extension', 'category_id', 'description', 
-                          'is_active', 'treat_as_archive', 'treat_as_disc', 'treat_as_auxiliary']:
-                    set_clauses.append(f"{key} = ?")
-                    params.append(value)
-            
-            if not set_clauses:
-                return False
-            
-            # Add updated_at timestamp
-            set_clauses.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
-            
-            params.append(extension)
-            query = f"UPDATE file_extension SET {', '.join(set_clauses)} WHERE extension = ?"
-            
-            cursor.execute(query, params)
+            cursor.execute(_update_sql('file_extension', columns, 'extension = ?', touch=True), params)
             conn.commit()
+            self.invalidate_caches()
             
             self.logger.info(f"Updated file extension {extension}")
             return cursor.rowcount > 0
@@ -275,6 +803,13 @@ class ExtensionRegistryManager:
     # PLATFORM EXTENSION MAPPING OPERATIONS
     # =============================================================================
     
+    def get_platforms(self) -> List[Dict]:
+        """Get all platforms that extensions can be mapped to, ordered by name."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT platform_id, name FROM platform ORDER BY name")
+            return self._fetch_dicts(cursor)
+    
     def create_platform_extension(
         self,
         platform_id: int,
@@ -291,6 +826,7 @@ class ExtensionRegistryManager:
                 VALUES (?, ?, ?)
             """, (platform_id, extension, is_primary))
             conn.commit()
+            self.invalidate_caches()
             
             self.logger.info(f"Created platform-extension mapping: Platform {platform_id} -> Extension {extension}")
             return True
@@ -322,33 +858,21 @@ class ExtensionRegistryManager:
             query += " ORDER BY p.name, pe.is_primary DESC, fe.extension"
             
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return self._fetch_dicts(cursor)
     
     def update_platform_extension(self, platform_id: int, extension: str, **kwargs) -> bool:
         """Update a platform-extension mapping."""
-        if not kwargs:
+        columns = tuple(column for column in _MAPPING_UPDATE_COLUMNS if column in kwargs)
+        if not columns:
             return False
-            
+        params = [kwargs[column] for column in columns]
+        params.extend([platform_id, extension])
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Build dynamic update query
-            set_clauses = []
-            params = []
-            
-            for key, value in kwargs.items():
-                if key in ['is_primary']:
-                    set_clauses.append(f"{key} = ?")
-                    params.append(value)
-            
-            if not set_clauses:
-                return False
-            
-            params.extend([platform_id, extension])
-            query = f"UPDATE platform_extension SET {', '.join(set_clauses)} WHERE platform_id = ? AND extension = ?"
-            
-            cursor.execute(query, params)
+            cursor.execute(_update_sql('platform_extension', columns, 'platform_id = ? AND extension = ?'), params)
             conn.commit()
+            self.invalidate_caches()
             
             self.logger.info(f"Updated platform-extension mapping: Platform {platform_id} -> Extension {extension}")
             return cursor.rowcount > 0
@@ -360,6 +884,7 @@ class ExtensionRegistryManager:
             cursor.execute("DELETE FROM platform_extension WHERE platform_id = ? AND extension = ?", 
                          (platform_id, extension))
             conn.commit()
+            self.invalidate_caches()
             
             self.logger.info(f"Deleted platform-extension mapping: Platform {platform_id} -> Extension {extension}")
             return cursor.rowcount > 0
@@ -373,37 +898,76 @@ class ExtensionRegistryManager:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            # Check if extension already exists
-            cursor.execute("SELECT unknown_extension_id, file_count FROM unknown_extension WHERE extension = ?", 
-                         (extension,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing record
-                new_count = existing['file_count'] + file_count
-                cursor.execute("""
-                    UPDATE unknown_extension 
-                    SET file_count = ?, last_seen = ?
-                    WHERE extension = ?
-                """, (new_count, datetime.now().isoformat(), extension))
-                conn.commit()
-                
-                self.logger.info(f"Updated unknown extension: {extension} (count: {new_count})")
-                return existing['unknown_extension_id']
+            # One upsert adds to the count of an existing record
+            upsert = """
+                INSERT INTO unknown_extension (extension, file_count)
+                VALUES (?, ?)
+                ON CONFLICT(extension) DO UPDATE
+                SET file_count = file_count + excluded.file_count, last_seen = ?
+            """
+            params = (extension, file_count, datetime.now().isoformat())
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                cursor.execute(upsert + " RETURNING unknown_extension_id, file_count", params)
+                row = cursor.fetchone()
             else:
-                # Create new record
-                cursor.execute("""
+                cursor.execute(upsert, params)
+                cursor.execute(
+                    "SELECT unknown_extension_id, file_count FROM unknown_extension WHERE extension = ?",
+                    (extension,),
+                )
+                row = cursor.fetchone()
+            conn.commit()
+            self.invalidate_caches(registry=False)
+            
+            self.logger.info(f"Recorded unknown extension: {extension} (count: {row['file_count']})")
+            return row['unknown_extension_id']
+    
+    def record_unknown_extensions(self, counts: Dict[str, int]) -> int:
+        """Record many unknown extension discoveries in one transaction.
+        
+        ``counts`` maps extensions to the number of files seen; extensions are
+        lowercased and given a leading dot. Counts are added to existing rows.
+        Returns the number of extensions recorded.
+        """
+        rows = {}
+        for extension, file_count in counts.items():
+            extension = extension.strip().lower()
+            if not extension:
+                continue
+            if not extension.startswith('.'):
+                extension = f".{extension}"
+            rows[extension] = rows.get(extension, 0) + file_count
+        if not rows:
+            return 0
+        
+        seen_at = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany("""
                     INSERT INTO unknown_extension (extension, file_count)
                     VALUES (?, ?)
-                """, (extension, file_count))
-                unknown_id = cursor.lastrowid
+                    ON CONFLICT(extension) DO UPDATE
+                    SET file_count = file_count + excluded.file_count, last_seen = ?
+                """, [(extension, file_count, seen_at) for extension, file_count in rows.items()])
                 conn.commit()
-                
-                self.logger.info(f"Recorded new unknown extension: {extension} (count: {file_count})")
-                return unknown_id
+            except Exception:
+                conn.rollback()
+                raise
+            
+            self.invalidate_caches(registry=False)
+            self.logger.info(f"Recorded {len(rows)} unknown extensions")
+            return len(rows)
     
-    def get_unknown_extensions(self, status: str = None) -> List[Dict]:
-        """Get unknown extensions with optional status filtering."""
+    def get_unknown_extensions(self, status: str = None, search: str = None,
+                               limit: int = None, offset: int = 0) -> List[Dict]:
+        """Get unknown extensions with optional status filtering.
+        
+        ``search`` matches a case-insensitive substring of the extension;
+        ``limit``/``offset`` page through the ordered result.
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
@@ -420,36 +984,34 @@ class ExtensionRegistryManager:
                 query += " AND ue.status = ?"
                 params.append(status)
             
-            query += " ORDER BY ue.file_count DESC, ue.first_seen DESC"
+            if search:
+                pattern = "%" + re.sub(r"([\\%_])", r"\\\1", search) + "%"
+                query += " AND ue.extension LIKE ? ESCAPE '\\'"
+                params.append(pattern)
+            
+            # The id breaks ties so pages do not overlap
+            query += " ORDER BY ue.file_count DESC, ue.first_seen DESC, ue.unknown_extension_id"
+            
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
             
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return self._fetch_dicts(cursor)
     
     def update_unknown_extension(self, unknown_extension_id: int, **kwargs) -> bool:
         """Update an unknown extension record."""
-        if not kwargs:
+        columns = tuple(column for column in _UNKNOWN_UPDATE_COLUMNS if column in kwargs)
+        if not columns:
             return False
-            
+        params = [kwargs[column] for column in columns]
+        params.append(unknown_extension_id)
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Build dynamic update query
-            set_clauses = []
-            params = []
-            
-            for key, value in kwargs.items():
-                if key in ['suggested_category_id', 'suggested_platform_id', 'status', 'notes']:
-                    set_clauses.append(f"{key} = ?")
-                    params.append(value)
-            
-            if not set_clauses:
-                return False
-            
-            params.append(unknown_extension_id)
-            query = f"UPDATE unknown_extension SET {', '.join(set_clauses)} WHERE unknown_extension_id = ?"
-            
-            cursor.execute(query, params)
+            cursor.execute(_update_sql('unknown_extension', columns, 'unknown_extension_id = ?'), params)
             conn.commit()
+            self.invalidate_caches(registry=False)
             
             self.logger.info(f"Updated unknown extension ID {unknown_extension_id}")
             return cursor.rowcount > 0
@@ -462,63 +1024,91 @@ class ExtensionRegistryManager:
         notes: Optional[str] = None,
     ) -> bool:
         """Approve an unknown extension and create the corresponding extension record."""
+        return self.approve_unknown_extensions(
+            [unknown_extension_id], category_id, platform_id, notes
+        ) == 1
+    
+    def approve_unknown_extensions(
+        self,
+        unknown_extension_ids: List[int],
+        category_id: int,
+        platform_id: Optional[int] = None,
+        notes: Optional[str] = None,
+    ) -> int:
+        """Approve several unknown extensions in one transaction.
+        
+        Returns the number of unknown extensions approved; nothing is written
+        if any statement fails.
+        """
+        if not unknown_extension_ids:
+            return 0
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
             try:
-                cursor.execute("BEGIN TRANSACTION")
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 # Get the unknown extension details
-                cursor.execute("SELECT * FROM unknown_extension WHERE unknown_extension_id = ?", 
-                             (unknown_extension_id,))
-                unknown_ext = cursor.fetchone()
+                placeholders = ", ".join("?" for _ in unknown_extension_ids)
+                cursor.execute(
+                    f"SELECT unknown_extension_id, extension FROM unknown_extension "
+                    f"WHERE unknown_extension_id IN ({placeholders})",
+                    list(unknown_extension_ids),
+                )
+                unknown_exts = cursor.fetchall()
                 
-                if not unknown_ext:
-                    return False
+                if not unknown_exts:
+                    conn.rollback()
+                    return 0
                 
-                # Create the file extension if it does not already exist
-                cursor.execute(
+                # Create the file extensions that do not already exist
+                cursor.executemany(
                     """
                     INSERT OR IGNORE INTO file_extension
                     (extension, category_id, description, is_active,
                      treat_as_archive, treat_as_disc, treat_as_auxiliary)
                     VALUES (?, ?, ?, 1, 0, 0, 0)
                     """,
-                    (
-                        unknown_ext["extension"],
-                        category_id,
-                        notes or "Auto-created from unknown extension",
-                    ),
+                    [
+                        (row["extension"], category_id, notes or "Auto-created from unknown extension")
+                        for row in unknown_exts
+                    ],
                 )
 
-                # Create platform mapping if platform specified
+                # Create platform mappings if platform specified
                 if platform_id:
-                    cursor.execute(
+                    cursor.executemany(
                         """
                         INSERT OR REPLACE INTO platform_extension (platform_id, extension, is_primary)
                         VALUES (?, ?, 1)
                         """,
-                        (platform_id, unknown_ext["extension"]),
+                        [(platform_id, row["extension"]) for row in unknown_exts],
                     )
                 
                 # Update unknown extension status
-                cursor.execute("""
+                cursor.executemany("""
                     UPDATE unknown_extension 
                     SET status = 'approved', suggested_category_id = ?, suggested_platform_id = ?, notes = ?
                     WHERE unknown_extension_id = ?
-                """, (category_id, platform_id, notes, unknown_extension_id))
+                """, [
+                    (category_id, platform_id, notes, row["unknown_extension_id"])
+                    for row in unknown_exts
+                ])
                 
-                cursor.execute("COMMIT")
+                conn.commit()
+                self.invalidate_caches()
                 
                 self.logger.info(
-                    "Approved unknown extension: %s", unknown_ext["extension"]
+                    "Approved unknown extensions: %s",
+                    ", ".join(row["extension"] for row in unknown_exts),
                 )
-                return True
+                return len(unknown_exts)
                 
             except Exception as e:
-                cursor.execute("ROLLBACK")
-                self.logger.error(f"Failed to approve unknown extension: {e}")
-                return False
+                conn.rollback()
+                self.logger.error(f"Failed to approve unknown extensions: {e}")
+                return 0
     
     def reject_unknown_extension(self, unknown_extension_id: int, notes: str = None) -> bool:
         """Reject an unknown extension."""
@@ -533,65 +1123,113 @@ class ExtensionRegistryManager:
     # =============================================================================
     
     def get_extension_registry_summary(self) -> Dict[str, Any]:
-        """Get a summary of the extension registry."""
+        """Get a summary of the extension registry.
+        
+        All counts come from one statement; the result is cached until the
+        next write through this or any other connection, or ``invalidate_caches``.
+        """
+        self._sync_data_version()
+        if self._summary_cache is not None and self._summary_cache[0] == self._data_version:
+            return {section: dict(stats) for section, stats in self._summary_cache[1].items()}
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # Get category counts
-            cursor.execute("""
-                SELECT COUNT(*) as total_categories,
-                       COUNT(CASE WHEN is_active = 1 THEN 1 END) as active_categories
-                FROM file_type_category
-            """)
-            category_stats = dict(cursor.fetchone())
-            
-            # Get extension counts
             cursor.execute(
                 """
-                SELECT
-                    COUNT(*) as total_extensions,
-                    COUNT(CASE WHEN is_active = 1 THEN 1 END) as active_extensions,
-                    COUNT(CASE WHEN treat_as_archive = 1 THEN 1 END) as archive_extensions,
-                    COUNT(CASE WHEN treat_as_disc = 1 THEN 1 END) as disc_extensions,
-                    COUNT(CASE WHEN treat_as_auxiliary = 1 THEN 1 END) as auxiliary_extensions,
-                    COUNT(
-                        CASE
-                            WHEN treat_as_archive = 0
-                             AND treat_as_disc = 0
-                             AND treat_as_auxiliary = 0 THEN 1
-                        END
-                    ) as rom_extensions
-                FROM file_extension
+                SELECT *
+                FROM (
+                    SELECT COUNT(*) as total_categories,
+                           COUNT(CASE WHEN is_active = 1 THEN 1 END) as active_categories
+                    FROM file_type_category
+                ), (
+                    SELECT
+                        COUNT(*) as total_extensions,
+                        COUNT(CASE WHEN is_active = 1 THEN 1 END) as active_extensions,
+                        COUNT(CASE WHEN treat_as_archive = 1 THEN 1 END) as archive_extensions,
+                        COUNT(CASE WHEN treat_as_disc = 1 THEN 1 END) as disc_extensions,
+                        COUNT(CASE WHEN treat_as_auxiliary = 1 THEN 1 END) as auxiliary_extensions,
+                        COUNT(
+                            CASE
+                                WHEN treat_as_archive = 0
+                                 AND treat_as_disc = 0
+                                 AND treat_as_auxiliary = 0 THEN 1
+                            END
+                        ) as rom_extensions
+                    FROM file_extension
+                ), (
+                    SELECT COUNT(*) as total_mappings,
+                           COUNT(CASE WHEN is_primary = 1 THEN 1 END) as primary_mappings,
+                           COUNT(DISTINCT platform_id) as platforms_with_mappings
+                    FROM platform_extension
+                ), (
+                    SELECT COUNT(*) as total_unknown,
+                           COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_unknown,
+                           COUNT(CASE WHEN status = 'approved' THEN 1 END) as approved_unknown,
+                           COUNT(CASE WHEN status = 'rejected' THEN 1 END) as rejected_unknown,
+                           COUNT(CASE WHEN status = 'ignored' THEN 1 END) as ignored_unknown
+                    FROM unknown_extension
+                )
                 """
             )
-            extension_stats = dict(cursor.fetchone())
-            
-            # Get platform mapping counts
-            cursor.execute("""
-                SELECT COUNT(*) as total_mappings,
-                       COUNT(CASE WHEN is_primary = 1 THEN 1 END) as primary_mappings,
-                       COUNT(DISTINCT platform_id) as platforms_with_mappings
-                FROM platform_extension
-            """)
-            mapping_stats = dict(cursor.fetchone())
-            
-            # Get unknown extension counts
-            cursor.execute("""
-                SELECT COUNT(*) as total_unknown,
-                       COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_unknown,
-                       COUNT(CASE WHEN status = 'approved' THEN 1 END) as approved_unknown,
-                       COUNT(CASE WHEN status = 'rejected' THEN 1 END) as rejected_unknown,
-                       COUNT(CASE WHEN status = 'ignored' THEN 1 END) as ignored_unknown
-                FROM unknown_extension
-            """)
-            unknown_stats = dict(cursor.fetchone())
-            
-            return {
-                'categories': category_stats,
-                'extensions': extension_stats,
-                'mappings': mapping_stats,
-                'unknown': unknown_stats
-            }
+            row = dict(cursor.fetchone())
+        
+        summary = {
+            section: {key: row[key] for key in keys}
+            for section, keys in self._SUMMARY_SECTIONS.items()
+        }
+        self._summary_cache = (self._data_version, summary)
+        return {section: dict(stats) for section, stats in summary.items()}
+    
+    def _cached_record(self, key: Tuple[str, Any], fetch: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Return a copy of a cached lookup, fetching it on a miss.
+        
+        Misses are cached too; entries last until categories, extensions or
+        mappings change.
+        """
+        self._sync_data_version()
+        if self._record_cache_version != self._registry_version:
+            self._record_cache = {}
+            self._record_cache_version = self._registry_version
+        if key not in self._record_cache:
+            self._record_cache[key] = fetch()
+        record = self._record_cache[key]
+        return dict(record) if record is not None else None
+    
+    def invalidate_caches(self, registry: bool = True):
+        """Discard cached results after the registry changes.
+        
+        Writes made through this manager call this automatically, and commits
+        from other connections are noticed through ``PRAGMA data_version``.
+        ``registry=False`` marks a change to unknown extensions only, which
+        keeps the in-memory extension and category lookups.
+        """
+        self._data_version += 1
+        if registry:
+            self._registry_version += 1
+    
+    def _sync_data_version(self):
+        """Invalidate cached results if another connection has committed.
+        
+        ``PRAGMA data_version`` only changes for commits made through other
+        connections, such as a second manager or the GUI's, so this costs
+        one pragma and this manager's own writes reload nothing twice.
+        """
+        with self._get_connection() as conn:
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._external_data_version:
+            if self._external_data_version is not None:
+                self.invalidate_caches()
+            self._external_data_version = version
+    
+    @property
+    def data_version(self) -> int:
+        """Counter that increases whenever cached results are invalidated.
+        
+        Commits from other connections count too, so callers keying their
+        own caches on it see those changes.
+        """
+        self._sync_data_version()
+        return self._data_version
     
     def detect_file_type(self, filename: str) -> Optional[Dict]:
         """Detect file type based on extension."""
@@ -609,6 +1247,51 @@ class ExtensionRegistryManager:
         self.record_unknown_extension(extension)
         return None
     
+    def detect_file_types(self, filenames: List[str]) -> Dict[str, Optional[Dict]]:
+        """Detect file types for many files from the in-memory extension records.
+        
+        Returns a dict mapping each filename to what :meth:`detect_file_type`
+        would return. Unknown extensions are recorded in one transaction.
+        """
+        suffixes = {filename: Path(filename).suffix.lower() for filename in filenames}
+        known = self._get_extension_records()
+        
+        unknown_counts: Dict[str, int] = {}
+        for suffix in suffixes.values():
+            if suffix and suffix not in known:
+                unknown_counts[suffix] = unknown_counts.get(suffix, 0) + 1
+        if unknown_counts:
+            self.record_unknown_extensions(unknown_counts)
+        
+        results = {}
+        for filename, suffix in suffixes.items():
+            record = known.get(suffix)
+            results[filename] = dict(record) if record is not None else None
+        return results
+    
+    def get_supported_extensions(self) -> Dict[str, FrozenSet[str]]:
+        """Return the active extensions usable as ROMs and as archives.
+        
+        Non-auxiliary extensions count as ROMs; extensions treated as archives
+        count as archives. SQLite tags and filters the rows in one query.
+        """
+        supported: Dict[str, set] = {'rom': set(), 'archive': set()}
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT 'rom', fe.extension
+                FROM file_extension fe
+                JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+                WHERE fe.is_active = 1 AND fe.treat_as_auxiliary = 0
+                UNION ALL
+                SELECT 'archive', fe.extension
+                FROM file_extension fe
+                JOIN file_type_category ftc ON fe.category_id = ftc.category_id
+                WHERE fe.is_active = 1 AND fe.treat_as_archive = 1
+            """).fetchall()
+        for kind, extension in rows:
+            supported[kind].add(extension)
+        return {kind: frozenset(extensions) for kind, extensions in supported.items()}
+    
     def get_extensions_for_platform(self, platform_id: int) -> List[Dict]:
         """Get all extensions associated with a platform."""
         return self.get_platform_extensions(platform_id=platform_id)
@@ -624,103 +1307,13 @@ class ExtensionRegistryManager:
     def export_extensions(self, file_path: str, format: str = 'json') -> bool:
         """Export extension registry data to file."""
         try:
-            # Get all data
-            categories = self.get_categories(active_only=False)
-            extensions = self.get_extensions(active_only=False)
-            mappings = self.get_platform_extensions()
-            unknown_extensions = self.get_unknown_extensions()
-            
-            # Prepare export data
-            export_data = {
-                'metadata': {
-                    'export_date': datetime.now().isoformat(),
-                    'version': '1.0',
-                    'format': format
-                },
-                'categories': categories,
-                'extensions': extensions,
-                'mappings': mappings,
-                'unknown_extensions': unknown_extensions
-            }
-            
-            if format.lower() == 'json':
-                import json
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
-            elif format.lower() == 'csv':
-                import csv
-                with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    
-                    # Write categories
-                    writer.writerow(['CATEGORIES'])
-                    writer.writerow(['category_id', 'name', 'description', 'sort_order', 'is_active'])
-                    for cat in categories:
-                        writer.writerow([
-                            cat['category_id'], cat['name'], cat['description'] or '',
-                            cat['sort_order'], cat['is_active']
-                        ])
-                    
-                    writer.writerow([])  # Empty row
-                    
-                    # Write extensions
-                    writer.writerow(['EXTENSIONS'])
-                    writer.writerow([
-                        'extension',
-                        'category_id',
-                        'description',
-                        'is_active',
-                        'treat_as_archive',
-                        'treat_as_disc',
-                        'treat_as_auxiliary',
-                    ])
-                    for ext in extensions:
-                        writer.writerow([
-                            ext['extension'],
-                            ext['category_id'],
-                            ext['description'] or '',
-                            ext['is_active'],
-                            ext['treat_as_archive'],
-                            ext['treat_as_disc'],
-                            ext['treat_as_auxiliary'],
-                        ])
-
-                    writer.writerow([])  # Empty row
-
-                    # Write mappings
-                    writer.writerow(['PLATFORM MAPPINGS'])
-                    writer.writerow([
-                        'platform_id',
-                        'platform_name',
-                        'extension',
-                        'is_primary',
-                    ])
-                    for mapping in mappings:
-                        writer.writerow([
-                            mapping['platform_id'],
-                            mapping['platform_name'],
-                            mapping['extension'],
-                            mapping['is_primary'],
-                        ])
-                    
-                    writer.writerow([])  # Empty row
-                    
-                    # Write unknown extensions
-                    writer.writerow(['UNKNOWN EXTENSIONS'])
-                    writer.writerow(['unknown_extension_id', 'extension', 'file_count', 'status', 
-                                   'suggested_category_id', 'suggested_platform_id', 'notes', 
-                                   'first_seen', 'last_seen'])
-                    for unknown in unknown_extensions:
-                        writer.writerow([
-                            unknown['unknown_extension_id'], unknown['extension'], unknown['file_count'],
-                            unknown['status'], unknown.get('suggested_category_id') or '', 
-                            unknown.get('suggested_platform_id') or '', unknown.get('notes') or '',
-                            unknown.get('first_seen') or '', unknown.get('last_seen') or ''
-                        ])
-            
-            else:
+            if format.lower() not in ('json', 'csv'):
                 raise ValueError(f"Unsupported export format: {format}")
+            with self._read_snapshot() as conn:
+                if format.lower() == 'json':
+                    self._export_json(conn, file_path, format)
+                else:
+                    self._export_csv(conn, file_path)
             
             self.logger.info(f"Exported extension registry to {file_path}")
             return True
@@ -729,14 +1322,95 @@ class ExtensionRegistryManager:
             self.logger.error(f"Failed to export extension registry: {e}")
             return False
     
-    def import_extensions(self, file_path: str, format: str = 'json', overwrite: bool = False) -> Dict[str, Any]:
-        """Import extension registry data from file."""
+    @contextmanager
+    def _read_snapshot(self):
+        """Hold the connection for one consistent read across several queries.
+        
+        The connection lock keeps other threads from writing through it, and
+        a single read transaction keeps out commits from other connections.
+        """
+        with self._get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.rollback()
+    
+    def _export_json(self, conn: sqlite3.Connection, file_path: str, format: str):
+        """Write the registry as one JSON document, streaming each section's rows.
+        
+        Rows are encoded one at a time as they are fetched; the layout matches
+        ``json.dump(..., indent=2)`` of the whole document.
+        """
+        import json
+        
+        metadata = {
+            'export_date': datetime.now().isoformat(),
+            'version': '1.0',
+            'format': format
+        }
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            write = f.write
+            write('{\n  "metadata": ')
+            write(json.dumps(metadata, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+            for key, query in self._JSON_EXPORT_SECTIONS:
+                format_row = self._format_extension_record if key == 'extensions' else dict
+                write(f',\n  "{key}": [')
+                separator = '\n    '
+                for row in self._iter_rows(conn, query):
+                    write(separator)
+                    write(json.dumps(format_row(row), indent=2, ensure_ascii=False).replace('\n', '\n    '))
+                    separator = ',\n    '
+                write(']' if separator == '\n    ' else '\n  ]')
+            write('\n}')
+    
+    def _export_csv(self, conn: sqlite3.Connection, file_path: str):
+        """Write the registry as titled CSV sections, streaming rows from the database."""
+        import csv
+        
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for index, (title, header, query) in enumerate(self._CSV_EXPORT_SECTIONS):
+                if index:
+                    writer.writerow([])  # Empty row
+                writer.writerow([title])
+                writer.writerow(header)
+                writer.writerows(self._iter_rows(conn, query))
+    
+    @staticmethod
+    def _iter_rows(conn: sqlite3.Connection, query: str, params: Tuple = (),
+                   batch_size: int = EXPORT_BATCH_SIZE):
+        """Yield the rows of a query, fetching ``batch_size`` at a time.
+        
+        Callers hold ``conn`` through ``_read_snapshot`` while iterating.
+        """
+        cursor = conn.execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+    
+    def import_extensions(self, file_path: str, format: str = 'json', overwrite: bool = False,
+                          batch_size: int = IMPORT_BATCH_SIZE) -> Dict[str, Any]:
+        """Import extension registry data from file.
+        
+        Each section is written as an upsert with one ``executemany`` per
+        ``batch_size`` rows, all inside a single ``BEGIN IMMEDIATE``
+        transaction that rolls back on any error. The counts report rows
+        actually inserted or updated.
+        """
         import_results = {
             'success': False,
             'categories_imported': 0,
             'extensions_imported': 0,
             'mappings_imported': 0,
             'unknown_imported': 0,
+            'duplicates_skipped': 0,
             'errors': []
         }
         
@@ -747,10 +1421,15 @@ class ExtensionRegistryManager:
                 cursor = conn.cursor()
 
                 try:
-                    self._import_categories(cursor, import_data, overwrite, import_results)
-                    self._import_extensions(cursor, import_data, overwrite, import_results)
-                    self._import_mappings(cursor, import_data, overwrite, import_results)
-                    self._import_unknown_extensions(cursor, import_data, overwrite, import_results)
+                    # Take the write lock before the reference checks read anything,
+                    # and check foreign keys once at commit instead of per row
+                    cursor.execute("BEGIN IMMEDIATE")
+                    cursor.execute("PRAGMA defer_foreign_keys = ON")
+                    lookups = _ImportLookups(cursor)
+                    self._import_categories(cursor, import_data, overwrite, import_results, batch_size)
+                    self._import_extensions(lookups, import_data, overwrite, import_results, batch_size)
+                    self._import_mappings(lookups, import_data, overwrite, import_results, batch_size)
+                    self._import_unknown_extensions(lookups, import_data, overwrite, import_results, batch_size)
 
                     if import_results['errors']:
                         conn.rollback()
@@ -760,6 +1439,7 @@ class ExtensionRegistryManager:
                         )
                     else:
                         conn.commit()
+                        self.invalidate_caches()
                         import_results['success'] = True
                         self.logger.info(f"Imported extension registry from {file_path}")
 
@@ -775,79 +1455,50 @@ class ExtensionRegistryManager:
         return import_results
     
     def _load_import_data(self, file_path: str, format: str) -> Dict[str, Any]:
-        """Load import data from file."""
+        """Load import data from file.
+        
+        Large files are streamed per section with ``ijson`` when it is
+        installed, so rows are written without parsing the whole document.
+        """
         if format.lower() != 'json':
             raise ValueError(f"Unsupported import format: {format}. Only 'json' is currently supported.")
 
+        if ijson is not None and os.path.getsize(file_path) >= self.STREAM_IMPORT_MIN_BYTES:
+            return {
+                section: self._stream_import_section(file_path, section)
+                for section in self._IMPORT_STATEMENTS
+            }
+
         import json
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
-    def _get_category_id_by_name(self, cursor, category_name: Optional[str]) -> Optional[int]:
-        """Resolve a category ID from its name."""
-        if not category_name:
-            return None
-
-        cursor.execute("SELECT category_id FROM file_type_category WHERE name = ?", (category_name,))
-        row = cursor.fetchone()
-        return row['category_id'] if row else None
-
-    def _extension_exists(self, cursor, extension_name: Optional[str]) -> bool:
-        """Check if an extension with the given name exists."""
-        if not extension_name:
-            return False
-
-        cursor.execute(
-            "SELECT 1 FROM file_extension WHERE extension = ?",
-            (extension_name,),
-        )
-        return cursor.fetchone() is not None
-
-    def _get_platform_id_by_name(self, cursor, platform_name: Optional[str], create_if_missing: bool = False) -> Optional[int]:
-        """Resolve a platform ID from its name, optionally creating it."""
-        if not platform_name:
-            return None
-
-        cursor.execute("SELECT platform_id FROM platform WHERE name = ?", (platform_name,))
-        if row := cursor.fetchone():
-            return row['platform_id']
-
-        if create_if_missing:
-            cursor.execute("INSERT INTO platform (name) VALUES (?)", (platform_name,))
-            return cursor.lastrowid
-
-        return None
+    @staticmethod
+    def _stream_import_section(file_path: str, section: str):
+        """Yield the rows of one section of a JSON import file."""
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, f'{section}.item', use_float=True)
 
     @staticmethod
     def _normalize_optional_id(value: Any) -> Optional[int]:
-        """Normalize optional identifier values from import data."""
-        return None if isinstance(value, str) and not value.strip() else value
-
-    def _category_exists(self, cursor, category_id: Optional[int]) -> bool:
-        """Check if a category with the given ID exists."""
-        if not category_id:
-            return False
-
-        cursor.execute(
-            "SELECT 1 FROM file_type_category WHERE category_id = ?",
-            (category_id,),
-        )
-        return cursor.fetchone() is not None
-
-    def _platform_exists(self, cursor, platform_id: Optional[int]) -> bool:
-        """Check if a platform with the given ID exists."""
-        if not platform_id:
-            return False
-
-        cursor.execute(
-            "SELECT 1 FROM platform WHERE platform_id = ?",
-            (platform_id,),
-        )
-        return cursor.fetchone() is not None
+        """Normalize optional identifier values from import data.
+        
+        Numeric strings become integers, as SQLite would coerce them, so
+        they match the keys held by ``_ImportLookups``.
+        """
+        if not isinstance(value, str):
+            return value
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return value
 
     def _resolve_category_reference(
         self,
-        cursor,
+        lookups: _ImportLookups,
         data: Dict[str, Any],
         import_results: Dict[str, Any],
         context: str,
@@ -856,7 +1507,7 @@ class ExtensionRegistryManager:
 
         category_name = (data.get('category_name') or data.get('category') or '').strip()
         if category_name:
-            resolved_category_id = self._get_category_id_by_name(cursor, category_name)
+            resolved_category_id = lookups.category_id(category_name)
             if resolved_category_id is not None:
                 return resolved_category_id
 
@@ -868,7 +1519,7 @@ class ExtensionRegistryManager:
             return None
 
         category_id = self._normalize_optional_id(data.get('category_id'))
-        if category_id and self._category_exists(cursor, category_id):
+        if category_id and lookups.has_category(category_id):
             return category_id
 
         if category_id:
@@ -884,7 +1535,7 @@ class ExtensionRegistryManager:
 
     def _resolve_extension_reference(
         self,
-        cursor,
+        lookups: _ImportLookups,
         data: Dict[str, Any],
         import_results: Dict[str, Any],
         context: str,
@@ -893,7 +1544,7 @@ class ExtensionRegistryManager:
 
         extension_name = (data.get("extension") or "").strip()
         if extension_name:
-            if self._extension_exists(cursor, extension_name):
+            if lookups.has_extension(extension_name):
                 return extension_name
 
             error = f"Extension '{extension_name}' not found while importing {context}."
@@ -908,7 +1559,7 @@ class ExtensionRegistryManager:
 
     def _resolve_platform_reference(
         self,
-        cursor,
+        lookups: _ImportLookups,
         data: Dict[str, Any],
         import_results: Dict[str, Any],
         context: str,
@@ -924,8 +1575,7 @@ class ExtensionRegistryManager:
         ).strip()
 
         if platform_name:
-            platform_id = self._get_platform_id_by_name(
-                cursor,
+            platform_id = lookups.platform_id(
                 platform_name,
                 create_if_missing=create_if_missing,
             )
@@ -942,7 +1592,7 @@ class ExtensionRegistryManager:
         platform_id = self._normalize_optional_id(
             data.get('platform_id') or data.get('suggested_platform_id')
         )
-        if platform_id and self._platform_exists(cursor, platform_id):
+        if platform_id and lookups.has_platform(platform_id):
             return platform_id
 
         if platform_id:
@@ -956,63 +1606,79 @@ class ExtensionRegistryManager:
         self.logger.error(error)
         return None
     
-    def _import_categories(self, cursor, import_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
+    def _import_batch(self, cursor, section: str, overwrite: bool, batch_size: int) -> _ImportBatch:
+        """Create the batch for a section's upsert.
+        
+        Existing rows are updated when ``overwrite`` is set and left alone
+        otherwise, so no existence check is needed per row. Updates only
+        touch rows whose copied columns differ, so unchanged rows are
+        neither rewritten nor counted. The conflict target leads each row's
+        parameters and keys the batch.
+        """
+        insert, target, columns, touch = self._IMPORT_STATEMENTS[section]
+        if overwrite:
+            assignments = [f"{column} = excluded.{column}" for column in columns]
+            if touch:
+                assignments.append("updated_at = datetime('now')")
+            changed = " OR ".join(f"{column} IS NOT excluded.{column}" for column in columns)
+            action = f"UPDATE SET {', '.join(assignments)} WHERE {changed}"
+        else:
+            action = "NOTHING"
+        return _ImportBatch(
+            cursor,
+            insert.strip(),
+            f"ON CONFLICT({target}) DO {action}",
+            batch_size,
+            key_size=target.count(',') + 1,
+            keep_last=overwrite,
+        )
+    
+    def _flush_import_batch(self, batch: _ImportBatch, section: str, counter: str, import_results: Dict[str, Any]):
+        """Write the rest of an import batch and count the rows it changed.
+        
+        Failed writes from any of the section's batches are recorded as
+        import errors.
+        """
+        batch.flush()
+        for error in batch.errors:
+            import_results['errors'].append(f"Error writing imported {section}: {error}")
+        import_results[counter] += batch.changes
+        import_results['duplicates_skipped'] += batch.duplicates
+    
+    def _import_categories(self, cursor, import_data: Dict[str, Any], overwrite: bool,
+                           import_results: Dict[str, Any], batch_size: int = IMPORT_BATCH_SIZE):
         """Import categories from import data."""
         if 'categories' not in import_data:
             return
-            
+        
+        batch = self._import_batch(cursor, 'categories', overwrite, batch_size)
         for cat_data in import_data['categories']:
             try:
-                self._import_single_category(cursor, cat_data, overwrite, import_results)
+                batch.add(_CATEGORY_IMPORT_ROW({**_CATEGORY_IMPORT_DEFAULTS, **cat_data}))
             except Exception as e:
                 import_results['errors'].append(f"Error importing category {cat_data.get('name', 'unknown')}: {e}")
+        self._flush_import_batch(batch, "categories", 'categories_imported', import_results)
     
-    def _import_single_category(self, cursor, cat_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
-        """Import a single category."""
-        cursor.execute("SELECT category_id FROM file_type_category WHERE name = ?", (cat_data['name'],))
-        existing = cursor.fetchone()
-
-        if existing:
-            if not overwrite:
-                return
-
-            cursor.execute("""
-                UPDATE file_type_category
-                SET description = ?, sort_order = ?, is_active = ?
-                WHERE category_id = ?
-            """, (cat_data.get('description'), cat_data.get('sort_order', 0),
-                 cat_data.get('is_active', True), existing['category_id']))
-        else:
-            cursor.execute("""
-                INSERT INTO file_type_category (name, description, sort_order, is_active)
-                VALUES (?, ?, ?, ?)
-            """, (cat_data['name'], cat_data.get('description'),
-                 cat_data.get('sort_order', 0), cat_data.get('is_active', True)))
-
-        import_results['categories_imported'] += 1
-    
-    def _import_extensions(self, cursor, import_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
+    def _import_extensions(self, lookups: _ImportLookups, import_data: Dict[str, Any], overwrite: bool,
+                           import_results: Dict[str, Any], batch_size: int = IMPORT_BATCH_SIZE):
         """Import extensions from import data."""
         if 'extensions' not in import_data:
             return
-            
+        
+        batch = self._import_batch(lookups.cursor, 'extensions', overwrite, batch_size)
         for ext_data in import_data['extensions']:
             try:
-                self._import_single_extension(cursor, ext_data, overwrite, import_results)
+                self._import_single_extension(lookups, ext_data, import_results, batch)
             except Exception as e:
                 import_results['errors'].append(f"Error importing extension {ext_data.get('extension', 'unknown')}: {e}")
+        self._flush_import_batch(batch, "extensions", 'extensions_imported', import_results)
     
-    def _import_single_extension(self, cursor, ext_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
-        """Import a single extension."""
+    def _import_single_extension(self, lookups: _ImportLookups, ext_data: Dict[str, Any],
+                                 import_results: Dict[str, Any], batch: _ImportBatch):
+        """Queue a single extension for import."""
         extension_name = ext_data['extension']
-        cursor.execute(
-            "SELECT extension, category_id FROM file_extension WHERE extension = ?",
-            (extension_name,),
-        )
-        existing = cursor.fetchone()
-
         category_id = self._resolve_category_reference(
-            cursor,
+            lookups,
             ext_data,
             import_results,
             f"extension {extension_name}",
@@ -1030,68 +1696,35 @@ class ExtensionRegistryManager:
             else ext_data.get("is_save", False) or ext_data.get("is_patch", False)
         )
 
-        if existing:
-            if not overwrite:
-                return
-
-            cursor.execute(
-                """
-                UPDATE file_extension
-                SET category_id = ?,
-                    description = ?,
-                    is_active = ?,
-                    treat_as_archive = ?,
-                    treat_as_disc = ?,
-                    treat_as_auxiliary = ?,
-                    updated_at = datetime('now')
-                WHERE extension = ?
-                """,
-                (
-                    category_id,
-                    ext_data.get("description"),
-                    ext_data.get("is_active", True),
-                    treat_as_archive,
-                    treat_as_disc,
-                    treat_as_auxiliary,
-                    extension_name,
-                ),
-            )
-        else:
-            cursor.execute(
-                """
-                INSERT INTO file_extension
-                (extension, category_id, description, is_active,
-                 treat_as_archive, treat_as_disc, treat_as_auxiliary)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    extension_name,
-                    category_id,
-                    ext_data.get("description"),
-                    ext_data.get("is_active", True),
-                    treat_as_archive,
-                    treat_as_disc,
-                    treat_as_auxiliary,
-                ),
-            )
-
-        import_results['extensions_imported'] += 1
+        batch.add((
+            extension_name,
+            category_id,
+            ext_data.get("description"),
+            ext_data.get("is_active", True),
+            treat_as_archive,
+            treat_as_disc,
+            treat_as_auxiliary,
+        ))
     
-    def _import_mappings(self, cursor, import_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
+    def _import_mappings(self, lookups: _ImportLookups, import_data: Dict[str, Any], overwrite: bool,
+                         import_results: Dict[str, Any], batch_size: int = IMPORT_BATCH_SIZE):
         """Import platform mappings from import data."""
         if 'mappings' not in import_data:
             return
-            
+        
+        batch = self._import_batch(lookups.cursor, 'mappings', overwrite, batch_size)
         for mapping_data in import_data['mappings']:
             try:
-                self._import_single_mapping(cursor, mapping_data, overwrite, import_results)
+                self._import_single_mapping(lookups, mapping_data, import_results, batch)
             except Exception as e:
                 import_results['errors'].append(f"Error importing mapping: {e}")
+        self._flush_import_batch(batch, "mappings", 'mappings_imported', import_results)
     
-    def _import_single_mapping(self, cursor, mapping_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
-        """Import a single platform mapping."""
+    def _import_single_mapping(self, lookups: _ImportLookups, mapping_data: Dict[str, Any],
+                               import_results: Dict[str, Any], batch: _ImportBatch):
+        """Queue a single platform mapping for import."""
         platform_id = self._resolve_platform_reference(
-            cursor,
+            lookups,
             mapping_data,
             import_results,
             f"mapping for extension {mapping_data.get('extension') or '[unknown extension]'}",
@@ -1101,7 +1734,7 @@ class ExtensionRegistryManager:
             return
 
         extension_name = self._resolve_extension_reference(
-            cursor,
+            lookups,
             mapping_data,
             import_results,
             f"mapping for platform {mapping_data.get('platform_name') or platform_id}",
@@ -1109,65 +1742,28 @@ class ExtensionRegistryManager:
         if not extension_name:
             return
 
-        cursor.execute(
-            """
-            SELECT 1 FROM platform_extension
-            WHERE platform_id = ? AND extension = ?
-            """,
-            (platform_id, extension_name),
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            if not overwrite:
-                return
-
-            cursor.execute(
-                """
-                UPDATE platform_extension
-                SET is_primary = ?
-                WHERE platform_id = ? AND extension = ?
-                """,
-                (
-                    mapping_data.get("is_primary", False),
-                    platform_id,
-                    extension_name,
-                ),
-            )
-        else:
-            cursor.execute(
-                """
-                INSERT INTO platform_extension (platform_id, extension, is_primary)
-                VALUES (?, ?, ?)
-                """,
-                (
-                    platform_id,
-                    extension_name,
-                    mapping_data.get("is_primary", False),
-                ),
-            )
-
-        import_results['mappings_imported'] += 1
+        batch.add((platform_id, extension_name, mapping_data.get("is_primary", False)))
     
-    def _import_unknown_extensions(self, cursor, import_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
+    def _import_unknown_extensions(self, lookups: _ImportLookups, import_data: Dict[str, Any], overwrite: bool,
+                                   import_results: Dict[str, Any], batch_size: int = IMPORT_BATCH_SIZE):
         """Import unknown extensions from import data."""
         if 'unknown_extensions' not in import_data:
             return
-            
+        
+        batch = self._import_batch(lookups.cursor, 'unknown_extensions', overwrite, batch_size)
         for unknown_data in import_data['unknown_extensions']:
             try:
-                self._import_single_unknown_extension(cursor, unknown_data, overwrite, import_results)
+                self._import_single_unknown_extension(lookups, unknown_data, import_results, batch)
             except Exception as e:
                 import_results['errors'].append(f"Error importing unknown extension {unknown_data.get('extension', 'unknown')}: {e}")
+        self._flush_import_batch(batch, "unknown extensions", 'unknown_imported', import_results)
     
-    def _import_single_unknown_extension(self, cursor, unknown_data: Dict[str, Any], overwrite: bool, import_results: Dict[str, Any]):
-        """Import a single unknown extension."""
-        cursor.execute("SELECT unknown_extension_id FROM unknown_extension WHERE extension = ?", (unknown_data['extension'],))
-        existing = cursor.fetchone()
-
+    def _import_single_unknown_extension(self, lookups: _ImportLookups, unknown_data: Dict[str, Any],
+                                         import_results: Dict[str, Any], batch: _ImportBatch):
+        """Queue a single unknown extension for import."""
         suggested_category_id = self._normalize_optional_id(unknown_data.get('suggested_category_id'))
         if category_name := (unknown_data.get('suggested_category') or '').strip():
-            resolved_category_id = self._get_category_id_by_name(cursor, category_name)
+            resolved_category_id = lookups.category_id(category_name)
             if resolved_category_id is None:
                 error = (
                     f"Could not resolve suggested category '{category_name}' for unknown extension "
@@ -1177,7 +1773,7 @@ class ExtensionRegistryManager:
                 self.logger.error(error)
                 return
             suggested_category_id = resolved_category_id
-        elif suggested_category_id and not self._category_exists(cursor, suggested_category_id):
+        elif suggested_category_id and not lookups.has_category(suggested_category_id):
             error = (
                 f"Suggested category ID {suggested_category_id} could not be resolved for unknown extension "
                 f"{unknown_data['extension']}. Skipping import."
@@ -1188,7 +1784,7 @@ class ExtensionRegistryManager:
 
         suggested_platform_id = self._normalize_optional_id(unknown_data.get('suggested_platform_id'))
         if platform_name := (unknown_data.get('suggested_platform') or '').strip():
-            suggested_platform_id = self._get_platform_id_by_name(cursor, platform_name, create_if_missing=True)
+            suggested_platform_id = lookups.platform_id(platform_name, create_if_missing=True)
             if suggested_platform_id is None:
                 error = (
                     f"Could not resolve suggested platform '{platform_name}' for unknown extension "
@@ -1197,7 +1793,7 @@ class ExtensionRegistryManager:
                 import_results['errors'].append(error)
                 self.logger.error(error)
                 return
-        elif suggested_platform_id and not self._platform_exists(cursor, suggested_platform_id):
+        elif suggested_platform_id and not lookups.has_platform(suggested_platform_id):
             error = (
                 f"Suggested platform ID {suggested_platform_id} could not be resolved for unknown extension "
                 f"{unknown_data['extension']}. Skipping import."
@@ -1206,25 +1802,9 @@ class ExtensionRegistryManager:
             self.logger.error(error)
             return
 
-        if existing:
-            if not overwrite:
-                return
-
-            cursor.execute("""
-                UPDATE unknown_extension
-                SET file_count = ?, status = ?, suggested_category_id = ?,
-                    suggested_platform_id = ?, notes = ?
-                WHERE unknown_extension_id = ?
-            """, (unknown_data.get('file_count', 1), unknown_data.get('status', 'pending'),
-                 suggested_category_id, suggested_platform_id,
-                 unknown_data.get('notes'), existing['unknown_extension_id']))
-        else:
-            cursor.execute("""
-                INSERT INTO unknown_extension
-                (extension, file_count, status, suggested_category_id, suggested_platform_id, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (unknown_data['extension'], unknown_data.get('file_count', 1),
-                 unknown_data.get('status', 'pending'), suggested_category_id,
-                 suggested_platform_id, unknown_data.get('notes')))
-
-        import_results['unknown_imported'] += 1
+        batch.add(_UNKNOWN_IMPORT_ROW({
+            **_UNKNOWN_IMPORT_DEFAULTS,
+            **unknown_data,
+            'suggested_category_id': suggested_category_id,
+            'suggested_platform_id': suggested_platform_id,
+        }))
@@ -22,7 +22,7 @@ import sqlite3
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 import fnmatch
 
 try:
@@ -76,6 +76,11 @@ class LibraryIngestionImporter(BaseImporter):
             'errors': 0
         }
     
+    def close(self):
+        """Clean up database connections."""
+        self.extension_registry.close()
+        super().close()
+    
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from project root."""
         import json
@@ -105,38 +110,26 @@ class LibraryIngestionImporter(BaseImporter):
 
         return config
     
-    def _load_supported_extensions(self) -> Dict[str, List[str]]:
-        """Load supported file extensions from the extension registry."""
+    def _load_supported_extensions(self) -> Dict[str, FrozenSet[str]]:
+        """Load supported file extensions from the extension registry.
+        
+        Each type maps to a frozenset so per-file membership checks are O(1).
+        """
         try:
-            # Get all active extensions
-            extensions = self.extension_registry.get_extensions(active_only=True)
-            
-            # Group by type
-            supported = {
-                'rom': [],
-                'archive': [],
-            }
-
-            for ext in extensions:
-                ext_name = ext['extension']
-
-                if ext['treat_as_archive']:
-                    supported['archive'].append(ext_name)
-
-                # Treat any non-auxiliary extension as ROM-compatible
-                if not ext['treat_as_auxiliary']:
-                    supported['rom'].append(ext_name)
-
-            self.logger.info(f"Loaded {len(extensions)} supported extensions from registry")
+            supported = self.extension_registry.get_supported_extensions()
+            self.logger.info(
+                f"Loaded {len(supported['rom'] | supported['archive'])} supported extensions from registry"
+            )
             return supported
 
         except Exception as e:
             self.logger.warning(f"Failed to load extensions from registry: {e}")
             # Fallback to config-based extensions
-            return self.ingestion_settings.get('file_extensions', {
+            configured = self.ingestion_settings.get('file_extensions', {
                 'rom': ['.rom', '.bin', '.nes', '.sfc', '.smd', '.gb', '.gba', '.nds'],
                 'archive': ['.zip', '.7z', '.rar', '.tar', '.gz'],
             })
+            return {kind: frozenset(names) for kind, names in configured.items()}
     
     def get_file_type_description(self):
         return "Library File Ingestion"
@@ -345,13 +338,13 @@ class LibraryIngestionImporter(BaseImporter):
         
         # Check if extension is in our supported lists (fallback)
         # Check ROM extensions
-        rom_extensions = self.supported_extensions.get('rom', [])
+        rom_extensions = self.supported_extensions.get('rom', frozenset())
         if file_ext in rom_extensions:
             return True
         
         # Check archive extensions
         if self.enable_archive_expansion:
-            archive_extensions = self.supported_extensions.get('archive', [])
+            archive_extensions = self.supported_extensions.get('archive', frozenset())
             if file_ext in archive_extensions:
                 return True
         
@@ -808,7 +801,7 @@ class LibraryIngestionImporter(BaseImporter):
             return True
         
         # Fallback to supported extensions list
-        archive_extensions = self.supported_extensions.get('archive', [])
+        archive_extensions = self.supported_extensions.get('archive', frozenset())
         return file_path.suffix.lower() in archive_extensions
     
     def _expand_archive(self, file_path: Path, log_id: int, source_id: int):
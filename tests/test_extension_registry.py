@@ -7,9 +7,11 @@ import json
 import os
 import sqlite3
 import tempfile
+import threading
 import unittest
 from typing import Optional
 
+import extension_registry_manager
 from extension_registry_manager import ExtensionRegistryManager
 
 
@@ -25,6 +27,7 @@ class ExtensionRegistryTestCase(unittest.TestCase):
         self._export_path: Optional[str] = None
 
     def tearDown(self) -> None:
+        self.manager.close()
         if self._export_path and os.path.exists(self._export_path):
             os.unlink(self._export_path)
         if os.path.exists(self.db_path):
@@ -156,6 +159,39 @@ class TestExtensionRegistryCRUD(ExtensionRegistryTestCase):
         assert record is not None
         self.assertFalse(record["is_active"])
 
+    def test_extension_search_and_paging(self) -> None:
+        """Extension queries should filter by substring and page in SQL order."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.manager.create_extension(".nes", rom_id, "Nintendo ROM")
+        self.manager.create_extension(".sfc", rom_id, "Super Nintendo ROM")
+        self.manager.create_extension(".md", rom_id, "Mega Drive 100%")
+
+        found = self.manager.get_extensions(search="NINTENDO")
+        self.assertEqual([ext["extension"] for ext in found], [".nes", ".sfc"])
+        found = self.manager.get_extensions(search="%")
+        self.assertEqual([ext["extension"] for ext in found], [".md"])
+
+        page = self.manager.get_extensions(limit=2, offset=1)
+        self.assertEqual([ext["extension"] for ext in page], [".nes", ".sfc"])
+
+        conn = self.manager._get_connection()
+        indexes = {row["name"] for row in conn.execute("PRAGMA index_list(file_extension)")}
+        self.assertIn("idx_file_extension_category_active", indexes)
+
+    def test_recreated_database_is_prepared_again(self) -> None:
+        """A database recreated at the same path gets its indexes and statistics."""
+        self.manager.get_categories()
+        self.manager.close()
+        os.unlink(self.db_path)
+        self._initialise_schema(self.db_path)
+
+        self.manager = ExtensionRegistryManager(self.db_path)
+        conn = self.manager._get_connection()
+        indexes = {row["name"] for row in conn.execute("PRAGMA index_list(unknown_extension)")}
+        self.assertIn("idx_unknown_extension_status_seen", indexes)
+        stats = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+        self.assertIsNotNone(stats)
+
     def test_platform_mapping_crud(self) -> None:
         """Ensure platform mappings honour the new composite key."""
         category_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
@@ -185,6 +221,33 @@ class TestExtensionRegistryCRUD(ExtensionRegistryTestCase):
         self.assertTrue(deleted)
         self.assertFalse(self.manager.get_platform_extensions(platform_id=platform_id))
 
+    def test_get_platforms_sorted_by_name(self) -> None:
+        """Platforms are listed by name for the mapping dialogs."""
+        snes_id = self._create_platform("SNES")
+        nes_id = self._create_platform("NES")
+
+        platforms = self.manager.get_platforms()
+
+        self.assertEqual(
+            platforms,
+            [
+                {"platform_id": nes_id, "name": "NES"},
+                {"platform_id": snes_id, "name": "SNES"},
+            ],
+        )
+
+    def test_supported_extensions_by_type(self) -> None:
+        """Active non-auxiliary extensions are ROMs; archive flags add archives."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.manager.create_extension(".nes", rom_id, "NES ROM")
+        self.manager.create_extension(".zip", rom_id, "Archive", treat_as_archive=True)
+        self.manager.create_extension(".sav", rom_id, "Save", treat_as_auxiliary=True)
+        self.manager.create_extension(".old", rom_id, "Retired", is_active=False)
+
+        supported = self.manager.get_supported_extensions()
+        self.assertEqual(supported["rom"], frozenset({".nes", ".zip"}))
+        self.assertEqual(supported["archive"], frozenset({".zip"}))
+
     def test_summary_counts_reflect_flags(self) -> None:
         """Summary output should align with treat_as_* semantics."""
         rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
@@ -210,6 +273,139 @@ class TestExtensionRegistryCRUD(ExtensionRegistryTestCase):
         self.assertEqual(summary["extensions"]["archive_extensions"], 1)
         self.assertEqual(summary["extensions"]["disc_extensions"], 1)
 
+    def test_connection_journal_mode(self) -> None:
+        """The shared connection should use WAL unless it is opted out."""
+        conn = self.manager._get_connection()
+        self.assertIs(conn, self.manager._get_connection())
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        other_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        other_db.close()
+        self.addCleanup(lambda: os.path.exists(other_db.name) and os.unlink(other_db.name))
+        self._initialise_schema(other_db.name)
+        plain_manager = ExtensionRegistryManager(other_db.name, use_wal=False)
+        self.addCleanup(plain_manager.close)
+        journal_mode = plain_manager._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(journal_mode, "delete")
+
+        # synchronous: NORMAL is 1, FULL is 2
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+        full_manager = ExtensionRegistryManager(other_db.name, durability="full")
+        self.addCleanup(full_manager.close)
+        self.assertEqual(full_manager._get_connection().execute("PRAGMA synchronous").fetchone()[0], 2)
+        with self.assertRaises(ValueError):
+            ExtensionRegistryManager(other_db.name, durability="off")
+
+    def test_shared_connection_across_threads(self) -> None:
+        """Writes from several threads share the manager's connection safely."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        errors = []
+
+        def create(start: int) -> None:
+            try:
+                for i in range(start, start + 25):
+                    self.manager.create_extension(f".t{i}", rom_id, f"Thread {i}")
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=create, args=(n * 25,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.manager.get_extensions()), 100)
+
+    def test_close_waits_for_statements_on_other_threads(self) -> None:
+        """Closing the manager waits for a block running on another thread."""
+        conn = self.manager._get_connection()
+        entered, release = threading.Event(), threading.Event()
+
+        def hold() -> None:
+            with conn:
+                entered.set()
+                release.wait(5)
+                conn.execute("SELECT COUNT(*) FROM file_extension").fetchone()
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        entered.wait(5)
+        closer = threading.Thread(target=self.manager.close)
+        closer.start()
+        closer.join(timeout=0.2)
+        self.assertTrue(closer.is_alive())
+
+        release.set()
+        holder.join(timeout=5)
+        closer.join(timeout=5)
+        self.assertFalse(closer.is_alive())
+        self.assertIsNone(self.manager._connection)
+
+    def test_lookup_cache_tracks_writes(self) -> None:
+        """Cached single-record lookups are refreshed after writes."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.assertIsNone(self.manager.get_extension_by_name(".nes"))
+        self.manager.create_extension(".nes", rom_id, "NES ROM")
+        record = self.manager.get_extension_by_name(".nes")
+        self.assertEqual(record["description"], "NES ROM")
+
+        record["description"] = "changed by caller"
+        self.assertEqual(self.manager.get_extension_by_name(".nes")["description"], "NES ROM")
+
+        self.manager.update_extension(".nes", description="Famicom ROM")
+        self.assertEqual(self.manager.get_extension_by_name(".nes")["description"], "Famicom ROM")
+        self.manager.update_category(rom_id, name="Cartridge")
+        self.assertEqual(self.manager.get_category(rom_id)["name"], "Cartridge")
+
+    def test_lookups_see_writes_from_other_managers(self) -> None:
+        """Cached lookups reload after another connection commits."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.assertIsNotNone(self.manager.get_category(rom_id))
+        self.assertIsNone(self.manager.detect_file_type("a.sfc"))
+
+        other = ExtensionRegistryManager(self.db_path)
+        self.addCleanup(other.close)
+        other.create_extension(".sfc", rom_id, "SNES ROM")
+        other.update_category(rom_id, description="Renamed")
+
+        self.assertIsNotNone(self.manager.detect_file_type("b.sfc"))
+        self.assertEqual(self.manager.get_category(rom_id)["description"], "Renamed")
+        unknown = self.manager.get_unknown_extensions()
+        self.assertEqual([(row["extension"], row["file_count"]) for row in unknown], [(".sfc", 1)])
+
+    def test_unknown_writes_keep_extension_lookups_in_memory(self) -> None:
+        """Recording unknown extensions does not reload the extension records."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.manager.create_extension(".nes", rom_id, "NES ROM")
+        self.assertIsNotNone(self.manager.detect_file_type("game.nes"))
+
+        statements = []
+        self.manager._get_connection().set_trace_callback(statements.append)
+        self.assertIsNone(self.manager.detect_file_type("notes.txt"))
+        self.assertIsNotNone(self.manager.detect_file_type("other.nes"))
+        self.assertFalse(any("FROM file_extension" in statement for statement in statements))
+
+    def test_summary_cache_tracks_writes(self) -> None:
+        """Cached summaries should refresh after writes from any connection."""
+        category_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        summary = self.manager.get_extension_registry_summary()
+        self.assertEqual(summary["extensions"]["total_extensions"], 0)
+
+        self.manager.create_extension(".nes", category_id, "ROM")
+        summary = self.manager.get_extension_registry_summary()
+        self.assertEqual(summary["extensions"]["total_extensions"], 1)
+
+        version = self.manager.data_version
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM file_extension")
+        conn.commit()
+        conn.close()
+        summary = self.manager.get_extension_registry_summary()
+        self.assertEqual(summary["extensions"]["total_extensions"], 0)
+        self.assertEqual(summary["categories"]["total_categories"], 1)
+        self.assertGreater(self.manager.data_version, version)
+
 
 class TestUnknownExtensionWorkflow(ExtensionRegistryTestCase):
     """Tests covering detection and unknown extension approval."""
@@ -231,6 +427,32 @@ class TestUnknownExtensionWorkflow(ExtensionRegistryTestCase):
         self.assertEqual(recorded[0]["extension"], ".weird")
         self.assertEqual(recorded[0]["file_count"], 1)
 
+        unknown_id = self.manager.record_unknown_extension(".weird", 4)
+        self.assertEqual(unknown_id, recorded[0]["unknown_extension_id"])
+        self.assertEqual(self.manager.get_unknown_extensions()[0]["file_count"], 5)
+
+    def test_record_unknown_extensions_in_bulk(self) -> None:
+        """Bulk recording normalises extensions and adds to existing counts."""
+        self.manager.record_unknown_extension(".iso", 2)
+        recorded = self.manager.record_unknown_extensions({"ISO": 3, ".bin": 1, ".BIN": 4, "": 9})
+        self.assertEqual(recorded, 2)
+        counts = {row["extension"]: row["file_count"] for row in self.manager.get_unknown_extensions()}
+        self.assertEqual(counts, {".iso": 5, ".bin": 5})
+        self.assertEqual(self.manager.record_unknown_extensions({}), 0)
+
+    def test_detect_file_types_in_bulk(self) -> None:
+        """Bulk detection matches per-file detection and counts unknown files."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.manager.create_extension(".nes", rom_id, "NES ROM")
+
+        results = self.manager.detect_file_types(["a.NES", "b.nes", "c.zzz", "d.zzz", "README"])
+        self.assertEqual(results["a.NES"]["extension"], ".nes")
+        self.assertEqual(results["b.nes"]["category_name"], "ROM")
+        self.assertIsNone(results["c.zzz"])
+        self.assertIsNone(results["README"])
+        unknown = self.manager.get_unknown_extensions()
+        self.assertEqual([(row["extension"], row["file_count"]) for row in unknown], [(".zzz", 2)])
+
     def test_unknown_extension_approval(self) -> None:
         """Approving an unknown extension should create registry records."""
         category_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
@@ -257,6 +479,43 @@ class TestUnknownExtensionWorkflow(ExtensionRegistryTestCase):
         self.assertEqual(len(unknown_entries), 1)
         self.assertEqual(unknown_entries[0]["notes"], "Created during approval")
 
+    def test_unknown_extension_search_and_paging(self) -> None:
+        """Unknown extension queries should filter by substring and page by file count."""
+        self.manager.record_unknown_extension(".a_b", 3)
+        self.manager.record_unknown_extension(".ab", 2)
+        self.manager.record_unknown_extension(".abc", 1)
+
+        found = self.manager.get_unknown_extensions(search="_")
+        self.assertEqual([ext["extension"] for ext in found], [".a_b"])
+        found = self.manager.get_unknown_extensions(search="AB")
+        self.assertEqual([ext["extension"] for ext in found], [".ab", ".abc"])
+
+        page = self.manager.get_unknown_extensions(limit=2, offset=1)
+        self.assertEqual([ext["extension"] for ext in page], [".ab", ".abc"])
+
+    def test_bulk_unknown_extension_approval(self) -> None:
+        """Approving several unknown extensions should apply to each of them."""
+        category_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        platform_id = self._create_platform("NES")
+        unknown_ids = [
+            self.manager.record_unknown_extension(extension)
+            for extension in (".one", ".two", ".three")
+        ]
+
+        approved = self.manager.approve_unknown_extensions(
+            unknown_ids[:2], category_id=category_id, platform_id=platform_id
+        )
+        self.assertEqual(approved, 2)
+        self.assertEqual(self.manager.approve_unknown_extensions([], category_id), 0)
+
+        self.assertIsNotNone(self.manager.get_extension(".one"))
+        self.assertIsNotNone(self.manager.get_extension(".two"))
+        self.assertIsNone(self.manager.get_extension(".three"))
+        mappings = self.manager.get_platform_extensions(platform_id=platform_id)
+        self.assertEqual({mapping["extension"] for mapping in mappings}, {".one", ".two"})
+        pending = self.manager.get_unknown_extensions(status="pending")
+        self.assertEqual([entry["extension"] for entry in pending], [".three"])
+
 
 class TestImportExportRoundTrip(ExtensionRegistryTestCase):
     """Validate import/export flows against the new schema."""
@@ -289,6 +548,7 @@ class TestImportExportRoundTrip(ExtensionRegistryTestCase):
         self.addCleanup(lambda: os.path.exists(other_db.name) and os.unlink(other_db.name))
         self._initialise_schema(other_db.name)
         new_manager = ExtensionRegistryManager(other_db.name)
+        self.addCleanup(new_manager.close)
 
         results = new_manager.import_extensions(self._export_path, "json", overwrite=True)
         self.assertTrue(results["success"])
@@ -296,6 +556,165 @@ class TestImportExportRoundTrip(ExtensionRegistryTestCase):
         self.assertEqual(len(new_manager.get_platform_extensions()), 1)
         self.assertEqual(len(new_manager.get_unknown_extensions()), 1)
 
+    def test_json_import_in_batches(self) -> None:
+        """Imports spanning several batches keep the last row for duplicate keys."""
+        self.manager.create_category("ROM", "Game ROM files", 1, True)
+        extensions = [
+            {"extension": f".r{i}", "category_name": "ROM", "description": f"ROM {i}"}
+            for i in range(7)
+        ]
+        extensions.append({"extension": ".r0", "category_name": "ROM", "description": "Updated"})
+        payload = {
+            "extensions": extensions,
+            "mappings": [
+                {"platform_name": "NES", "extension": f".r{i}", "is_primary": i == 0}
+                for i in range(7)
+            ],
+            "unknown_extensions": [
+                {"extension": ".odd", "file_count": 2},
+                {"extension": ".odd", "file_count": 5},
+            ],
+        }
+        export_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w")
+        json.dump(payload, export_file)
+        export_file.close()
+        self._export_path = export_file.name
+
+        statements = []
+        self.manager._get_connection().set_trace_callback(statements.append)
+        results = self.manager.import_extensions(self._export_path, "json", overwrite=True, batch_size=3)
+        self.manager._get_connection().set_trace_callback(None)
+        self.assertTrue(results["success"], results["errors"])
+        # References resolve from one read per table rather than per row
+        self.assertEqual(sum("SELECT" in statement for statement in statements), 3)
+        self.assertEqual(results["unknown_imported"], 1)
+        self.assertEqual(results["duplicates_skipped"], 2)
+        self.assertEqual(len(self.manager.get_extensions()), 7)
+        self.assertEqual(self.manager.get_extension(".r0")["description"], "Updated")
+        self.assertEqual(len(self.manager.get_platform_extensions()), 7)
+        unknown = self.manager.get_unknown_extensions()
+        self.assertEqual(len(unknown), 1)
+        self.assertEqual(unknown[0]["file_count"], 5)
+
+    def test_json_import_references_and_failed_batches(self) -> None:
+        """String IDs resolve like integers and failed rows are reported once."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        platform_id = self._create_platform("NES")
+        payload = {
+            "extensions": [{"extension": ".nes", "category_id": str(rom_id)}],
+            "mappings": [{"platform_id": f" {platform_id} ", "extension": ".nes"}],
+            "unknown_extensions": [
+                {"extension": ".bad", "file_count": None},
+                {"extension": ".odd", "suggested_category_id": str(rom_id)},
+            ],
+        }
+        export_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w")
+        json.dump(payload, export_file)
+        export_file.close()
+        self._export_path = export_file.name
+
+        results = self.manager.import_extensions(self._export_path, "json", batch_size=1)
+        self.assertEqual(results["extensions_imported"], 1)
+        self.assertEqual(results["mappings_imported"], 1)
+        self.assertEqual(results["unknown_imported"], 1)
+        self.assertEqual(len(results["errors"]), 1, results["errors"])
+        self.assertIn("Error writing imported unknown extensions", results["errors"][0])
+        self.assertFalse(results["success"])
+
+    def test_json_import_reports_failed_batch_writes(self) -> None:
+        """A failed batch write is reported for the section, not the row that filled it."""
+        payload = {"categories": [{"name": None}, {"name": "C1"}, {"name": "C2"}]}
+        export_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w")
+        json.dump(payload, export_file)
+        export_file.close()
+        self._export_path = export_file.name
+
+        results = self.manager.import_extensions(self._export_path, "json", batch_size=3)
+        self.assertFalse(results["success"])
+        self.assertEqual(len(results["errors"]), 1, results["errors"])
+        self.assertTrue(results["errors"][0].startswith("Error writing imported categories: NOT NULL"))
+        self.assertEqual(self.manager.get_categories(active_only=False), [])
+
+    def test_json_import_counts_written_rows(self) -> None:
+        """Existing rows are only counted and changed when overwriting a difference."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.manager.create_extension(".nes", rom_id, "NES ROM")
+        export_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
+        export_file.close()
+        self._export_path = export_file.name
+        self.assertTrue(self.manager.export_extensions(self._export_path, "json"))
+        self.manager.update_extension(".nes", description="Edited")
+
+        results = self.manager.import_extensions(self._export_path, "json", overwrite=False)
+        self.assertTrue(results["success"], results["errors"])
+        self.assertEqual(results["categories_imported"], 0)
+        self.assertEqual(results["extensions_imported"], 0)
+        self.assertEqual(self.manager.get_extension(".nes")["description"], "Edited")
+
+        results = self.manager.import_extensions(self._export_path, "json", overwrite=True)
+        self.assertTrue(results["success"], results["errors"])
+        self.assertEqual(results["categories_imported"], 0)  # unchanged rows are not rewritten
+        self.assertEqual(results["extensions_imported"], 1)
+        self.assertEqual(self.manager.get_extension(".nes")["description"], "NES ROM")
+
+        results = self.manager.import_extensions(self._export_path, "json", overwrite=True)
+        self.assertTrue(results["success"], results["errors"])
+        self.assertEqual(results["extensions_imported"], 0)
+
+    @unittest.skipUnless(extension_registry_manager.ijson, "ijson is not installed")
+    def test_json_import_streamed(self) -> None:
+        """Streamed imports write the same rows as a whole-file load."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        self.manager.create_extension(".nes", rom_id, "NES ROM")
+        platform_id = self._create_platform("NES")
+        self.manager.create_platform_extension(platform_id, ".nes", is_primary=True)
+        self.manager.record_unknown_extension(".mystery", 3)
+        export_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
+        export_file.close()
+        self._export_path = export_file.name
+        self.assertTrue(self.manager.export_extensions(self._export_path, "json"))
+
+        other_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        other_db.close()
+        self.addCleanup(lambda: os.path.exists(other_db.name) and os.unlink(other_db.name))
+        self._initialise_schema(other_db.name)
+        new_manager = ExtensionRegistryManager(other_db.name)
+        self.addCleanup(new_manager.close)
+
+        new_manager.STREAM_IMPORT_MIN_BYTES = 0
+        results = new_manager.import_extensions(self._export_path, "json", overwrite=True)
+        self.assertTrue(results["success"], results["errors"])
+        self.assertEqual(results["extensions_imported"], 1)
+        self.assertEqual(results["mappings_imported"], 1)
+        self.assertEqual(results["unknown_imported"], 1)
+
+    def test_export_reads_one_snapshot(self) -> None:
+        """Export sections see one snapshot and writers wait until it ends."""
+        rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)
+        for index in range(3):
+            self.manager.create_extension(f".r{index}", rom_id, "ROM")
+        query = "SELECT extension FROM file_extension ORDER BY extension"
+
+        writer = threading.Thread(target=self.manager.create_extension, args=(".late", rom_id, "ROM"))
+        with self.manager._read_snapshot() as conn:
+            first = [row["extension"] for row in self.manager._iter_rows(conn, query, batch_size=1)]
+            other = sqlite3.connect(self.db_path)
+            other.execute("DELETE FROM file_extension WHERE extension = '.r0'")
+            other.commit()
+            other.close()
+            writer.start()
+            writer.join(timeout=0.2)
+            self.assertTrue(writer.is_alive())
+            second = [row["extension"] for row in self.manager._iter_rows(conn, query)]
+        writer.join(timeout=5)
+
+        self.assertEqual(first, [".r0", ".r1", ".r2"])
+        self.assertEqual(second, first)
+        self.assertEqual(
+            [ext["extension"] for ext in self.manager.get_extensions(active_only=False)],
+            [".late", ".r1", ".r2"],
+        )
+
     def test_csv_export_structure(self) -> None:
         """Ensure CSV export writes headers expected by tooling."""
         rom_id = self.manager.create_category("ROM", "Game ROM files", 1, True)